@@ -1,2 +1,24 @@
-"""Allow users to access the class directly."""
+"""Allow users to access the classes directly."""
 from bitlist.bitlist import bitlist
+
+# The classes other than :obj:`bitlist` are not needed by the core type, so
+# the module that contains each of them is only imported when it is accessed.
+_MODULES = {
+    'record': 'fields',
+    'bitindex': 'index',
+    'bloom': 'filters',
+    'crc': 'registers',
+    'lfsr': 'registers',
+    'bitmatrix': 'matrix'
+}
+
+def __getattr__(name: str):
+    """
+    Import (on first access) and return a class defined in an optional module.
+    """
+    if name not in _MODULES:
+        raise AttributeError("module 'bitlist' has no attribute " + repr(name))
+
+    import importlib # pylint: disable=import-outside-toplevel
+    value = globals()[name] = getattr(importlib.import_module('bitlist.' + _MODULES[name]), name)
+    return value
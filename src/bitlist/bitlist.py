@@ -1,11 +1,47 @@
 """
 Pure-Python library for working with bit vectors.
 """
+# pylint: disable=too-many-lines
 from __future__ import annotations
-from typing import Union, Optional, Set, Sequence, Iterable
-import doctest
 import collections.abc
-from parts import parts
+import itertools
+
+# The :obj:`typing` module is only needed by static analysis tools (as all
+# annotations are postponed), so it is not imported at runtime. Other modules
+# that are needed only by some methods are imported when they are first used.
+TYPE_CHECKING = False
+if TYPE_CHECKING: # pragma: no cover
+    from typing import Union, Optional, Set, Sequence, Iterable, Iterator
+    from typing import Tuple, List, Dict, Callable
+
+_TO_DIGITS = bytes.maketrans(bytes([0, 1]), b'01')
+_FROM_DIGITS = bytes.maketrans(b'01', bytes([0, 1]))
+_INVERT = bytes.maketrans(bytes([0, 1]), bytes([1, 0]))
+
+def _order(order: str) -> bool:
+    """
+    Validate a bit order parameter and return a boolean value that
+    indicates whether the order is little-endian.
+    """
+    if order not in ('big', 'little'):
+        raise ValueError("order must be 'big' or 'little'")
+
+    return order == 'little'
+
+def _digits(n: int, length: int = 0) -> bytearray:
+    """
+    Return the big-endian binary digits of a non-negative integer (padded
+    on the left with zeros to the specified length) as a byte array in
+    which each entry is ``0`` or ``1``.
+    """
+    return bytearray(format(n, '0' + str(length) + 'b'), 'ascii').translate(_FROM_DIGITS)
+
+def _weight(n: int) -> int:
+    """
+    Return the number of ones in the binary representation of a
+    non-negative integer.
+    """
+    return bin(n).count('1')
 
 class bitlist:
     """
@@ -39,15 +75,27 @@ class bitlist:
 
     A :obj:`bitlist` instance can be converted into an integer using the
     built-in :obj:`int` function. By default, a big-endian representation of
-    integers is used. The recommended approach for switching to a
-    little-endian representation is to reverse the bit vector.
+    integers is used. The :obj:`to_int` method can be used to interpret the
+    bit vector as a little-endian representation instead.
 
     >>> b = bitlist('1111011')
     >>> int(b)
     123
+    >>> b.to_int(order='little')
+    111
     >>> int(bitlist(list(reversed(b))))
     111
 
+    The ``order`` parameter of the constructor can likewise be used to build
+    a bit vector that contains the little-endian representation of an integer
+    (or, for a bytes-like object, in which the bits of each byte appear in
+    little-endian order).
+
+    >>> bitlist(6, order='little')
+    bitlist('011')
+    >>> bitlist(bytes([1, 128]), order='little')
+    bitlist('1000000000000001')
+
     An instance can be converted into a string of binary characters using
     the :obj:`bin` method and into a hexadecimal string using the :obj:`hex`
     method. Conversion to a bytes-like object is possible via the built-in
@@ -87,6 +135,23 @@ class bitlist:
     >>> tuple(bitlist('1010'))
     (1, 0, 1, 0)
 
+    Derived values (the integer represented by an instance, its bytes-like
+    representation, and the number of bits that are set) are cached until
+    the instance is modified. Caching can be disabled for an individual
+    instance (or for all instances) by setting the ``caching`` attribute of
+    the instance (or of the class) to ``False``.
+
+    >>> b = bitlist('1101')
+    >>> (int(b), b.hex(), b.count())
+    (13, '0d', 3)
+    >>> b[0] = 0
+    >>> (int(b), b.hex(), b.count())
+    (5, '05', 2)
+    >>> b.caching = False
+    >>> b[1] = 0
+    >>> (int(b), b.count(0))
+    (1, 3)
+
     When the constructor is supplied a :obj:`bitlist` instance, a distinct copy
     of the supplied instance is created.
 
@@ -98,6 +163,26 @@ class bitlist:
     >>> c
     bitlist('11111011')
 
+    The copy shares the underlying storage with the supplied instance until
+    either of them is modified (at which point the modified instance makes its
+    own private copy of the storage), so creating a copy is inexpensive.
+
+    >>> c = bitlist(b)
+    >>> b[1] = 0
+    >>> (b, c)
+    (bitlist('00111011'), bitlist('01111011'))
+    >>> import copy
+    >>> d = copy.copy(c)
+    >>> d[7] = 0
+    >>> (c, d)
+    (bitlist('01111011'), bitlist('01111010'))
+
+    The ``bits`` attribute of an instance refers to its underlying storage (a
+    byte array in which the bits appear in reverse order and from which some
+    leading zeros may be omitted). This attribute is **read-only**: the storage
+    may be shared with copies and derived values may be cached, so an instance
+    must only be modified via index or slice assignment or via its methods.
+
     When the constructor is applied to a bytes-like object, the leading zero
     digits (*i.e.*, those on the left-hand side) **are retained** (up to the
     least multiple of eight larger than the minimum number of binary digits
@@ -185,6 +270,24 @@ class bitlist:
     >>> bitlist(bitlist(123), 8)
     bitlist('01111011')
 
+    Padding is not stored explicitly, so padding a bit vector to a large length
+    is inexpensive. The padding is stored only if some of its bits are set.
+
+    >>> b = bitlist(1, 2 ** 40)
+    >>> len(b)
+    1099511627776
+    >>> (int(b), b[-1], b[0], b[2 ** 40 - 1], len(b.bits))
+    (1, 1, 0, 1, 1)
+    >>> b[2 ** 40 - 3] = 1
+    >>> (int(b), len(b), len(b.bits))
+    (5, 1099511627776, 3)
+    >>> (b[-41:-1], len(b[-41:-1].bits))
+    (bitlist('0000000000000000000000000000000000000010'), 2)
+    >>> bitlist(5, 8)[1:6:2]
+    bitlist('001')
+    >>> list(bitlist(5, 8))
+    [0, 0, 0, 0, 0, 1, 0, 1]
+
     If the ``length`` parameter has a value that is less than the minimum
     number of bits that would be included according to a default behavior, the
     bit vector is truncated *on the left-hand side* to match the specified
@@ -203,6 +306,22 @@ class bitlist:
     >>> bitlist([1, 1, 1], 0)
     bitlist()
 
+    When the ``order`` parameter is ``'little'``, the most significant bits
+    appear on the right-hand side. Thus, any padding and truncation occurs
+    *on the right-hand side*.
+
+    >>> bitlist(1, 4, order='little')
+    bitlist('1000')
+    >>> bitlist(bytes([123]), 4, order='little')
+    bitlist('1101')
+
+    The ``order`` parameter only affects integer and bytes-like arguments (as
+    strings, iterables, and :obj:`bitlist` instances already specify the exact
+    sequence of bits).
+
+    >>> bitlist('0011', order='little')
+    bitlist('0011')
+
     Any attempt to construct an instance using unsupported arguments raises an
     exception.
 
@@ -218,47 +337,69 @@ class bitlist:
     Traceback (most recent call last):
       ...
     TypeError: bitlist constructor received unsupported argument
+    >>> bitlist(-1)
+    Traceback (most recent call last):
+      ...
+    ValueError: integer argument must be non-negative
+    >>> bitlist(1, order='middle')
+    Traceback (most recent call last):
+      ...
+    ValueError: order must be 'big' or 'little'
     """
     def __init__(
             self: bitlist,
             argument: Union[int, str, bytes, bytearray, bitlist, Iterable[int], None] = None,
-            length: Optional[int] = None
+            length: Optional[int] = None,
+            order: str = 'big'
         ):
         """
         Parse argument depending on its type and build a bit vector instance.
         """
         # pylint: disable=too-many-branches
+        # The bits are stored in reverse order (i.e., the least significant bit
+        # of a big-endian bit vector is at index ``0``). Thus, the big-endian
+        # digits of an integer are already in the storage order of a bit vector
+        # that uses little-endian order.
+        little = _order(order)
+        reverse = False # Whether the most significant bit is stored first.
+
         if argument is None:
             # By default, always return the bit vector representing zero.
             self.bits = bytearray([0])
 
         elif isinstance(argument, int):
+            if argument < 0:
+                raise ValueError('integer argument must be non-negative')
+
             # Convert any integer into its bit representation,
             # starting with the first non-zero digit.
-            self.bits = bytearray(reversed([int(b) for b in f'{argument:b}']))
+            self.bits = _digits(argument) if little else _digits(argument)[::-1]
+            reverse = little
 
         elif isinstance(argument, str):
-            if not all(c in ('0', '1') for c in argument):
+            if not set(argument) <= {'0', '1'}:
                 raise ValueError("each character in string must be '0' or '1'")
 
             # Convert string of binary digit characters.
-            self.bits = bytearray(reversed([int(b) for b in argument]))
+            self.bits = bytearray(argument, 'ascii').translate(_FROM_DIGITS)[::-1]
 
         elif isinstance(argument, (bytes, bytearray)):
             # Convert bytes-like object into its constituent bits,
             # with exactly eight bits per byte (i.e., leading zeros
             # are included).
-            self.bits = \
-                bytearray([
-                    b
-                    for byte in reversed(argument)
-                    for b in [(byte >> i) % 2 for i in range(0, 8)]
-                ])
+            self.bits = (
+                bytearray() if len(argument) == 0 else
+                _digits(int.from_bytes(argument, 'little'), 8 * len(argument)) if little else
+                _digits(int.from_bytes(argument, 'big'), 8 * len(argument))[::-1]
+            )
+            reverse = little
 
         elif isinstance(argument, bitlist):
-            # Make constructor idempotent (but have it iterate
-            # to reflect the behavior of the :obj:`list` function).
-            self.bits = bytearray(list(argument.bits))
+            # Make constructor idempotent (sharing the storage until
+            # either instance is modified).
+            self.bits = argument.bits
+            self._shared = argument._shared = True
+            self._padding = argument._padding
 
         elif isinstance(argument, collections.abc.Iterable):
             items = list(argument)
@@ -276,11 +417,189 @@ class bitlist:
             raise TypeError('bitlist constructor received unsupported argument')
 
         if length is not None:
-            # Pad or truncate the bit vector to ensure the specified length.
-            if length > len(self.bits):
-                self.bits = self.bits + bytes([0] * (length - len(self.bits)))
+            # Pad or truncate the bit vector to ensure the specified length
+            # (at the most significant end of the bit vector). Padding at the
+            # end of the storage is represented implicitly (and is only added
+            # to the storage if a bit within it is set).
+            if reverse:
+                self.bits = \
+                    (bytearray(length - len(self.bits)) + self.bits) \
+                    if length > len(self.bits) else \
+                    self.bits[len(self.bits) - length:]
             elif length < len(self.bits):
-                self.bits = self.bits[0:length]
+                (self.bits, self._padding) = (self.bits[0:length], 0)
+            else:
+                self._padding = length - len(self.bits)
+
+    # Indicates whether the storage of an instance may be shared with other
+    # instances (in which case it must be copied before it is modified).
+    _shared: bool = False
+
+    # Number of zero bits at the most significant end of the bit vector
+    # that are not included in the storage.
+    _padding: int = 0
+
+    def _full(self: bitlist) -> bytearray:
+        """
+        Return the storage of this instance with any implicit padding included
+        (copying the storage only if there is such padding).
+        """
+        return (self.bits + bytearray(self._padding)) if self._padding > 0 else self.bits
+
+    def _store(self: bitlist, size: int) -> bytearray:
+        """
+        Ensure that the storage of this instance contains at least the specified
+        number of bits (by adding to it as much of the implicit padding as is
+        necessary) and return the storage (which is not shared with any other
+        instance) so it can be modified.
+        """
+        bits = self._own()
+        if size > len(bits):
+            self._padding -= size - len(bits)
+            bits[len(bits):] = bytearray(size - len(bits))
+        return bits
+
+    def _materialize(self: bitlist) -> bytearray:
+        """
+        Add any implicit padding to the storage of this instance and return
+        the storage (which is not shared with any other instance) so it can be
+        modified.
+        """
+        return self._store(len(self))
+
+    # Indicates whether derived values are cached (can be set for an
+    # individual instance or for the class as a whole).
+    caching: bool = True
+
+    # Dictionary of cached derived values (if any have been computed).
+    _cache: Optional[Dict[Union[str, Tuple[str, str]], Union[int, bytes]]] = None
+
+    # Indicates whether modifications of an instance are disallowed.
+    _frozen: bool = False
+
+    def _cached(
+            self: bitlist,
+            key: Union[str, Tuple[str, str]],
+            compute: Callable[[], Union[int, bytes]]
+        ) -> Union[int, bytes]:
+        """
+        Return the cached value for the supplied key (computing and, if
+        caching is enabled, storing it if necessary).
+        """
+        if not self.caching:
+            return compute()
+
+        if self._cache is None:
+            self._cache = {}
+        elif key in self._cache:
+            return self._cache[key]
+
+        value = self._cache[key] = compute()
+        return value
+
+    def freeze(self: bitlist) -> bitlist:
+        """
+        Disallow any further modification of this instance and return it.
+        Frozen instances are hashable (consistent with the equality method
+        :obj:`__eq__`, which compares the integer values of instances).
+
+        >>> b = bitlist('0101').freeze()
+        >>> {b: 'x'}[bitlist('101').freeze()]
+        'x'
+        >>> b[0] = 1
+        Traceback (most recent call last):
+          ...
+        TypeError: frozen bitlist cannot be modified
+        >>> c = bitlist(b)
+        >>> c[0] = 1
+        >>> (b, c)
+        (bitlist('0101'), bitlist('1101'))
+        >>> hash(c)
+        Traceback (most recent call last):
+          ...
+        TypeError: unhashable type: 'bitlist' (only frozen instances are hashable)
+
+        Note that because the class defines :obj:`__hash__`, class-level checks
+        such as :obj:`collections.abc.Hashable` treat *all* instances as hashable.
+
+        >>> import collections.abc
+        >>> isinstance(bitlist('1'), collections.abc.Hashable)
+        True
+        """
+        self._frozen = True
+        return self
+
+    def __hash__(self: bitlist) -> int:
+        """
+        Return the hash of a frozen instance (see :obj:`freeze`).
+        """
+        if not self._frozen:
+            raise TypeError(
+                "unhashable type: 'bitlist' (only frozen instances are hashable)"
+            )
+
+        return self._cached('hash', lambda: hash(int(self)))
+
+    def _own(self: bitlist) -> bytearray:
+        """
+        Ensure that the storage of this instance is not shared with any other
+        instance (copying it if necessary) and return it so it can be modified.
+        Any cached derived values are discarded.
+        """
+        if self._frozen:
+            raise TypeError('frozen bitlist cannot be modified')
+
+        self._cache = None
+        if self._shared:
+            self.bits = bytearray(self.bits)
+            self._shared = False
+        return self.bits
+
+    def __copy__(self: bitlist) -> bitlist:
+        """
+        Return a copy of this instance (that shares its storage until either
+        instance is modified).
+        """
+        return bitlist(self)
+
+    @staticmethod
+    def _from_bits(bits: bytearray, padding: int = 0) -> bitlist:
+        """
+        Build an instance directly from a byte array in which the bits
+        are stored in reverse order (*i.e.*, in the order used internally)
+        and the number of zero bits of implicit padding that follow them.
+        An empty bit vector is treated in the same way as an empty iterable.
+        """
+        b = bitlist.__new__(bitlist)
+        b.bits = bits if len(bits) + padding > 0 else bytearray([0])
+        if padding > 0:
+            b._padding = padding # pylint: disable=protected-access
+        return b
+
+    @staticmethod
+    def _from_int(n: int, length: int) -> bitlist:
+        """
+        Build an instance of the specified length that represents a
+        non-negative integer (that fits within that length).
+        """
+        bits = _digits(n)[::-1]
+        return bitlist._from_bits(bits, max(0, length - len(bits)))
+
+    @staticmethod
+    def from_bytes(data: Union[bytes, bytearray], order: str = 'big') -> bitlist:
+        """
+        Build an instance from a bytes-like object. The ``order`` parameter
+        specifies the order of the bits within each byte.
+
+        >>> bitlist.from_bytes(bytes([1, 2]))
+        bitlist('0000000100000010')
+        >>> bitlist.from_bytes(bytes([1, 2]), order='little')
+        bitlist('1000000001000000')
+        >>> n = 12345
+        >>> bitlist.from_bytes(n.to_bytes(2, 'little'), 'little') == bitlist(n, 16, 'little')
+        True
+        """
+        return bitlist(data, order=order)
 
     @staticmethod
     def fromhex(s: str) -> bitlist:
@@ -302,7 +621,7 @@ class bitlist:
         """
         return \
             'bitlist(' + \
-            (("'" + self.bin() + "'") if len(self.bits) > 0 else '') + \
+            (("'" + self.bin() + "'") if len(self) > 0 else '') + \
             ')'
 
     def __repr__(self: bitlist) -> str:
@@ -320,13 +639,42 @@ class bitlist:
         >>> int(bitlist(bytes([128, 129]))) == int.from_bytes(bytes([128, 129]), 'big')
         True
         """
-        return sum(b*(2**i) for (i, b) in enumerate(self.bits))
+        return self._cached(
+            'int',
+            lambda: int(self.bits[::-1].translate(_TO_DIGITS), 2) if len(self.bits) > 0 else 0
+        )
+
+    def to_int(self: bitlist, order: str = 'big') -> int:
+        """
+        Interpret the bit vector as a representation of an integer (using the
+        specified bit order) and return that integer.
+
+        >>> bitlist('1101').to_int()
+        13
+        >>> bitlist('1101').to_int(order='little')
+        11
+        >>> bitlist(11, 16, order='little').to_int(order='little')
+        11
+        >>> bitlist(123, 0).to_int(order='little')
+        0
+        """
+        if not _order(order):
+            return int(self)
+
+        return self._cached(
+            ('int', order),
+            lambda: \
+                (int(self.bits.translate(_TO_DIGITS), 2) << self._padding) \
+                if len(self.bits) > 0 else 0
+        )
 
-    def to_bytes(self: bitlist) -> bytes:
+    def to_bytes(self: bitlist, order: str = 'big') -> bytes:
         """
         Return a bytes-like object representation. Note that the
         number of bits will be padded (on the left) to a multiple
-        of eight.
+        of eight. The ``order`` parameter specifies the order of
+        the bits within each byte; if it is ``'little'``, the bit
+        vector is padded *on the right-hand side* instead.
 
         >>> int.from_bytes(bitlist('10000000').to_bytes(), 'big')
         128
@@ -338,11 +686,15 @@ class bitlist:
         '8081'
         >>> bitlist('11').to_bytes().hex()
         '03'
+        >>> list(bitlist('1000000001').to_bytes(order='little'))
+        [1, 2]
+        >>> bitlist.from_bytes(bitlist('1000000001').to_bytes('little'), 'little')
+        bitlist('1000000001000000')
         """
-        return bytes(reversed([
-            int(bitlist(list(reversed(bs))))
-            for bs in parts(self.bits, length=8)
-        ]))
+        return self._cached(
+            ('bytes', order),
+            lambda: self.to_int(order).to_bytes((len(self) + 7) // 8, order)
+        )
 
     def bin(self: bitlist) -> str:
         """
@@ -352,7 +704,7 @@ class bitlist:
         >>> bitlist('010011').bin()
         '010011'
         """
-        return ''.join(list(reversed([str(b) for b in self.bits])))
+        return ('0' * self._padding) + self.bits[::-1].translate(_TO_DIGITS).decode('ascii')
 
     def hex(self: bitlist) -> str:
         """
@@ -372,7 +724,7 @@ class bitlist:
         >>> bitlist('11') + bitlist('10')
         bitlist('1110')
         """
-        return len(self.bits)
+        return len(self.bits) + self._padding
 
     def __add__(self: bitlist, other: bitlist) -> bitlist:
         """
@@ -382,7 +734,7 @@ class bitlist:
         >>> bitlist('11') + bitlist('10')
         bitlist('1110')
         """
-        return bitlist(list(reversed(list(other.bits)+list(self.bits))))
+        return bitlist._from_bits(other._full() + self.bits, self._padding)
 
     def __mul__(self: bitlist, other: int) -> bitlist:
         """
@@ -397,7 +749,7 @@ class bitlist:
         ValueError: repetition parameter must be an integer
         """
         if isinstance(other, int):
-            return bitlist(list(reversed(list(self.bits)))*other)
+            return bitlist._from_bits(self._full() * other)
 
         raise ValueError('repetition parameter must be an integer')
 
@@ -420,13 +772,15 @@ class bitlist:
         >>> bitlist('11010001') / 3
         [bitlist('110'), bitlist('100'), bitlist('01')]
         """
+        from parts import parts # pylint: disable=import-outside-toplevel
+
         if isinstance(other, set) and len(other) == 1 and isinstance(list(other)[0], int):
-            ps = parts(self.bits, length=list(other)[0])
+            ps = parts(self._full(), length=list(other)[0])
         elif isinstance(other, list):
-            ps = parts(self.bits, length=list(reversed(other)))
+            ps = parts(self._full(), length=list(reversed(other)))
         else:
-            ps = parts(self.bits, other)
-        return list(reversed([bitlist(list(reversed(p))) for p in ps]))
+            ps = parts(self._full(), other)
+        return [bitlist._from_bits(p) for p in ps][::-1]
 
     def __getitem__(self: bitlist, key: Union[int, slice]) -> Union[int, bitlist]:
         """
@@ -454,17 +808,29 @@ class bitlist:
             if key < 0: # Support big-endian interface using negative indices.
                 return self.bits[abs(key) - 1] if abs(key) <= len(self.bits) else 0
 
-            if key < len(self.bits):
-                return self.bits[len(self.bits) - 1 - key]
+            if key < len(self):
+                j = len(self) - 1 - key
+                return self.bits[j] if j < len(self.bits) else 0
 
             raise IndexError('bitlist index out of range')
 
         if isinstance(key, slice):
-            return bitlist(list(reversed(self.bits))[key])
+            (start, stop, step) = key.indices(len(self))
+            if step != 1:
+                return bitlist._from_bits(self._full()[::-1][key][::-1])
+
+            # Slice the storage directly (retaining any implicit padding).
+            (lower, upper) = (len(self) - max(start, stop), len(self) - start)
+            bits = self.bits[lower:upper]
+            return bitlist._from_bits(bits, upper - lower - len(bits))
 
         raise TypeError('bitlist indices must be integers or slices')
 
-    def __setitem__(self: bitlist, i: int, b: int):
+    def __setitem__(
+            self: bitlist,
+            i: Union[int, slice],
+            b: Union[int, bitlist, str, Iterable[int]]
+        ):
         """
         Set the bit at the specified index to the supplied value.
 
@@ -476,23 +842,275 @@ class bitlist:
         Traceback (most recent call last):
           ...
         IndexError: bitlist index out of range
+
+        A slice of the bit vector can be assigned either a single bit value
+        (which is then assigned to every bit in the slice) or a bit vector
+        (or any other value accepted by the :obj:`bitlist` constructor). The
+        assigned bit vector may have a different length than the slice unless
+        the slice has a step other than ``1``.
+
+        >>> x = bitlist('00000000')
+        >>> x[2:6] = 1
+        >>> x
+        bitlist('00111100')
+        >>> x[3:5] = 0
+        >>> x
+        bitlist('00100100')
+        >>> x[0:2] = bitlist('11')
+        >>> x
+        bitlist('11100100')
+        >>> x[-2:] = '101'
+        >>> x
+        bitlist('111001101')
+        >>> x[::2] = 0
+        >>> x
+        bitlist('010001000')
+        >>> x[1::4] = bitlist('00')
+        >>> x
+        bitlist('000000000')
+        >>> x[::2] = bitlist('11')
+        Traceback (most recent call last):
+          ...
+        ValueError: attempt to assign bit vector of length 2 to extended slice of length 5
+        >>> x[0:2] = 2
+        Traceback (most recent call last):
+          ...
+        ValueError: bit value must be 0 or 1
         """
+        if isinstance(i, slice):
+            self._assign(i, b)
+            return
+
         if i < 0: # Support big-endian interface using negative indices.
-            self.bits = \
-                bytearray([
-                    (self[j] if j != i else b)
-                    for j in range(-1, min(-len(self.bits), -abs(i)) - 1, -1)
-                ])
-        elif i < len(self.bits):
-            i = len(self.bits) - 1 - i
-            self.bits = \
-                bytearray([
-                    (self.bits[j] if j != i else b)
-                    for j in range(0, len(self.bits))
-                ])
+            j = -i - 1
+        elif i < len(self):
+            j = len(self) - 1 - i
         else:
             raise IndexError('bitlist index out of range')
 
+        bits = self._own()
+        if -i > len(self): # Extend the bit vector on the left.
+            self._padding += -i - len(self)
+
+        if j >= len(bits): # Index falls within the implicit padding.
+            if isinstance(b, int) and b == 0:
+                return
+
+            # Add only the padding up to (and including) the index to the storage.
+            bits = self._store(j + 1)
+
+        bits[j] = b
+
+    def _assign(self: bitlist, key: slice, b: Union[int, bitlist, str, Iterable[int]]):
+        """
+        Assign a bit value or a bit vector to a slice of this bit vector by
+        updating the corresponding region of the storage in bulk.
+        """
+        # pylint: disable=protected-access
+        if isinstance(b, int):
+            if b not in (0, 1):
+                raise ValueError('bit value must be 0 or 1')
+        elif not isinstance(b, bitlist):
+            b = bitlist(b)
+
+        length = len(self)
+        (start, stop, step) = key.indices(length)
+        if step == 1:
+            # The slice corresponds to a contiguous region of the storage.
+            (lower, upper) = (length - max(start, stop), length - start)
+            if isinstance(b, int) and b == 0:
+                bits = self._own()
+                bits[lower:upper] = bytearray(len(bits[lower:upper]))
+            else:
+                bits = self._store(upper)
+                bits[lower:upper] = \
+                    (b'\x01' * (upper - lower)) if isinstance(b, int) else b._full()
+            return
+
+        indices = range(length - 1, -1, -1)[key] # Indices within the storage.
+        if isinstance(b, bitlist) and len(b) != len(indices):
+            raise ValueError(
+                'attempt to assign bit vector of length ' + str(len(b)) +
+                ' to extended slice of length ' + str(len(indices))
+            )
+        if len(indices) == 0:
+            return
+
+        bits = self._materialize()
+        bits[indices.start:(indices.stop if indices.stop >= 0 else None):indices.step] = \
+            (bytes([b]) * len(indices)) if isinstance(b, int) else b._full()[::-1]
+
+    def fill(self: bitlist, start: Optional[int], stop: Optional[int], value: int):
+        """
+        Assign the supplied bit value to all bits from index ``start`` (inclusive)
+        to index ``stop`` (exclusive). This is equivalent to the assignment
+        ``b[start:stop] = value``.
+
+        >>> b = bitlist(0, 16)
+        >>> b.fill(4, 12, 1)
+        >>> b
+        bitlist('0000111111110000')
+        >>> b.fill(6, None, 0)
+        >>> b
+        bitlist('0000110000000000')
+        """
+        self._assign(slice(start, stop), value)
+
+    def flip(self: bitlist, start: Optional[int], stop: Optional[int]):
+        """
+        Invert all bits from index ``start`` (inclusive) to index ``stop``
+        (exclusive).
+
+        >>> b = bitlist('00001111')
+        >>> b.flip(2, 6)
+        >>> b
+        bitlist('00110011')
+        >>> b = bitlist(1, 2 ** 32)
+        >>> b.flip(-3, None)
+        >>> (int(b), len(b.bits))
+        (6, 3)
+        """
+        length = len(self)
+        (start, stop, _) = slice(start, stop).indices(length)
+        (lower, upper) = (length - max(start, stop), length - start)
+        bits = self._store(upper)
+        bits[lower:upper] = bits[lower:upper].translate(_INVERT)
+
+    def set_many(self: bitlist, indices: Iterable[int], value: int = 1):
+        """
+        Assign the supplied bit value to the bits at all of the specified
+        (non-negative) indices.
+
+        >>> b = bitlist(0, 8)
+        >>> b.set_many([0, 3, 7])
+        >>> b
+        bitlist('10010001')
+        >>> b.set_many(range(4), 0)
+        >>> b
+        bitlist('00000001')
+        >>> b.set_many([8])
+        Traceback (most recent call last):
+          ...
+        IndexError: bitlist index out of range
+        >>> b.set_many([0], 2)
+        Traceback (most recent call last):
+          ...
+        ValueError: bit value must be 0 or 1
+        """
+        if value not in (0, 1):
+            raise ValueError('bit value must be 0 or 1')
+
+        last = len(self) - 1
+        positions = [last - i for i in indices] # Indices within the storage.
+        if len(positions) > 0 and not 0 <= min(positions) <= max(positions) <= last:
+            raise IndexError('bitlist index out of range')
+
+        # Any bits within the implicit padding are already zero.
+        bits = self._store(max(positions, default=-1) + 1) if value == 1 else self._own()
+        for j in positions:
+            if j < len(bits):
+                bits[j] = value
+
+    def get_many(self: bitlist, indices: Iterable[int]) -> List[int]:
+        """
+        Return a list containing the values of the bits at all of the specified
+        (non-negative) indices.
+
+        >>> bitlist('1001', 8).get_many([0, 4, 5, 7])
+        [0, 1, 0, 1]
+        >>> bitlist('1001').get_many([-1])
+        Traceback (most recent call last):
+          ...
+        IndexError: bitlist index out of range
+        """
+        last = len(self) - 1
+        positions = [last - i for i in indices] # Indices within the storage.
+        if len(positions) > 0 and not 0 <= min(positions) <= max(positions) <= last:
+            raise IndexError('bitlist index out of range')
+
+        (bits, size) = (self.bits, len(self.bits))
+        return [(bits[j] if j < size else 0) for j in positions]
+
+    def __iter__(self: bitlist) -> Iterator[int]:
+        """
+        Return an iterator over the bits of the bit vector (from left to right).
+
+        >>> list(bitlist('1101'))
+        [1, 1, 0, 1]
+        >>> list(bitlist(123, 0))
+        []
+        """
+        if self._padding > 0:
+            return itertools.chain(itertools.repeat(0, self._padding), reversed(self.bits))
+
+        return reversed(self.bits)
+
+    def __reversed__(self: bitlist) -> Iterator[int]:
+        """
+        Return an iterator over the bits of the bit vector in reverse order
+        (*i.e.*, from right to left).
+
+        >>> list(reversed(bitlist('1101')))
+        [1, 0, 1, 1]
+        """
+        if self._padding > 0:
+            return itertools.chain(self.bits, itertools.repeat(0, self._padding))
+
+        return iter(self.bits)
+
+    def __contains__(self: bitlist, item: int) -> bool:
+        """
+        Determine whether a bit vector contains at least one bit that has
+        the supplied value.
+
+        >>> 1 in bitlist('0010')
+        True
+        >>> 1 in bitlist('0000')
+        False
+        >>> 0 in bitlist('1111')
+        False
+        >>> 2 in bitlist('1111')
+        False
+        >>> 'a' in bitlist('1111')
+        False
+        """
+        return item in (0, 1) and (int(item) in self.bits or (item == 0 and self._padding > 0))
+
+    def iter_ones(self: bitlist) -> Iterator[int]:
+        """
+        Yield the indices (in ascending order) of the bits that are set to
+        ``1``. The underlying byte array is searched directly for each set
+        bit, so the running time for sparse vectors depends primarily on
+        the number of set bits.
+
+        >>> list(bitlist('0110001').iter_ones())
+        [1, 2, 6]
+        >>> list(bitlist('0000').iter_ones())
+        []
+        """
+        (bits, last) = (self.bits, len(self) - 1)
+        j = bits.rfind(1)
+        while j != -1:
+            yield last - j
+            j = bits.rfind(1, 0, j)
+
+    def iter_zeros(self: bitlist) -> Iterator[int]:
+        """
+        Yield the indices (in ascending order) of the bits that are set to
+        ``0``.
+
+        >>> list(bitlist('0110001').iter_zeros())
+        [0, 3, 4, 5]
+        >>> list(bitlist('1111').iter_zeros())
+        []
+        """
+        yield from range(self._padding)
+        (bits, last) = (self.bits, len(self) - 1)
+        j = bits.rfind(0)
+        while j != -1:
+            yield last - j
+            j = bits.rfind(0, 0, j)
+
     def __lshift__(self: bitlist, n: Union[int, Set[int]]) -> bitlist:
         """
         The left shift operator can be used for both performing a bit shift
@@ -516,9 +1134,10 @@ class bitlist:
         """
         if isinstance(n, set) and len(n) == 1 and isinstance(list(n)[0], int):
             n = list(n)[0] % len(self) # Allow rotations to wrap around.
-            return bitlist(list(self.bits[n:]) + list(self.bits[:n]))
+            bits = self._full()
+            return bitlist._from_bits((bits[n:] + bits[:n])[::-1])
 
-        return bitlist(list(reversed(list([0] * n) + list(self.bits))))
+        return bitlist._from_bits(bytearray(n) + self.bits, self._padding)
 
     def __rshift__(self: bitlist, n: Union[int, Set[int]]) -> bitlist:
         """
@@ -543,9 +1162,13 @@ class bitlist:
         """
         if isinstance(n, set) and len(n) == 1 and isinstance(list(n)[0], int):
             n = list(n)[0] % len(self) # Allow rotations to wrap around.
-            return bitlist(list(self.bits[-n:]) + list(self.bits[:-n]))
+            bits = self._full()
+            return bitlist._from_bits((bits[-n:] + bits[:-n])[::-1])
 
-        return bitlist(list(reversed(self.bits[n:])))
+        return bitlist._from_bits(
+            self.bits[n:],
+            max(0, self._padding - max(0, n - len(self.bits)))
+        )
 
     def __and__(self: bitlist, other: bitlist) -> bitlist:
         """
@@ -563,9 +1186,7 @@ class bitlist:
                 'arguments to logical operations must have equal lengths'
             )
 
-        return bitlist(list(reversed(
-            [a & b for (a, b) in zip(self.bits, other.bits)]
-        )))
+        return bitlist._from_int(int(self) & int(other), len(self))
 
     def __or__(self: bitlist, other: bitlist) -> bitlist:
         """
@@ -582,9 +1203,7 @@ class bitlist:
             raise ValueError(
                 'arguments to logical operations must have equal lengths'
             )
-        return bitlist(list(reversed(
-            [a | b for (a, b) in zip(self.bits, other.bits)]
-        )))
+        return bitlist._from_int(int(self) | int(other), len(self))
 
     def __xor__(self: bitlist, other: bitlist) -> bitlist:
         """
@@ -601,9 +1220,7 @@ class bitlist:
             raise ValueError(
                 'arguments to logical operations must have equal lengths'
             )
-        return bitlist(list(reversed(
-            [a ^ b for (a, b) in zip(self.bits, other.bits)]
-        )))
+        return bitlist._from_int(int(self) ^ int(other), len(self))
 
     def __invert__(self: bitlist) -> bitlist:
         """
@@ -613,7 +1230,7 @@ class bitlist:
         >>> ~bitlist('0100')
         bitlist('1011')
         """
-        return bitlist(list(reversed([1-b for b in self.bits])))
+        return bitlist._from_bits(self._full().translate(_INVERT))
 
     def __bool__(self: bitlist) -> bool:
         """
@@ -626,6 +1243,78 @@ class bitlist:
         """
         return 1 in self.bits
 
+    def count(self: bitlist, value: int = 1) -> int:
+        """
+        Return the number of bits that have the specified value (by default,
+        the number of bits that are set).
+
+        >>> bitlist('0110111').count()
+        5
+        >>> bitlist('0110111').count(0)
+        2
+        >>> bitlist(1, 8).count(0)
+        7
+        >>> bitlist('01').count(2)
+        0
+        """
+        if value not in (0, 1):
+            return 0
+
+        ones = self._cached('count', lambda: self.bits.count(1))
+        return ones if value == 1 else len(self) - ones
+
+    def hamming(self: bitlist, other: bitlist) -> int:
+        """
+        Return the Hamming distance between two bit vectors (*i.e.*, the number
+        of positions at which their bits differ).
+
+        >>> bitlist('0110').hamming(bitlist('1100'))
+        2
+        >>> bitlist.hamming(bitlist('0110'), bitlist('0110'))
+        0
+        >>> bitlist('010').hamming(bitlist('11'))
+        Traceback (most recent call last):
+          ...
+        ValueError: bit vectors must have equal lengths
+        """
+        if len(self) != len(other):
+            raise ValueError('bit vectors must have equal lengths')
+
+        return _weight(int(self) ^ int(other))
+
+    def jaccard(self: bitlist, other: bitlist) -> float:
+        """
+        Return the Jaccard similarity between two bit vectors (*i.e.*, the number
+        of positions at which both bits are set divided by the number of positions
+        at which at least one bit is set). Two bit vectors in which no bits are set
+        are defined to have a similarity of ``1.0``.
+
+        >>> bitlist('0111').jaccard(bitlist('1100'))
+        0.25
+        >>> bitlist('0000').jaccard(bitlist('0000'))
+        1.0
+        >>> bitlist('010').jaccard(bitlist('11'))
+        Traceback (most recent call last):
+          ...
+        ValueError: bit vectors must have equal lengths
+        """
+        if len(self) != len(other):
+            raise ValueError('bit vectors must have equal lengths')
+
+        (x, y) = (int(self), int(other))
+        union = _weight(x | y)
+        return (_weight(x & y) / union) if union > 0 else 1.0
+
+    def tanimoto(self: bitlist, other: bitlist) -> float:
+        """
+        Return the Tanimoto similarity between two bit vectors. For bit vectors,
+        this coincides with the Jaccard similarity computed by :obj:`jaccard`.
+
+        >>> bitlist('0111').tanimoto(bitlist('0110'))
+        0.6666666666666666
+        """
+        return self.jaccard(other)
+
     def __eq__(self: bitlist, other: bitlist) -> bool:
         """
         Instances are interpreted as integers when relational
@@ -714,5 +1403,99 @@ class bitlist:
         """
         return int(self) >= int(other)
 
+    @staticmethod
+    def sorted(iterable: Iterable[bitlist], reverse: bool = False) -> List[bitlist]:
+        """
+        Return a new list containing the instances in the supplied iterable,
+        sorted by their integer values (so leading zeros are ignored, as with
+        the relational operators). Each integer value is computed only once
+        per instance and the sort is stable, so instances that represent the
+        same integer retain their relative order.
+
+        >>> bitlist.sorted([bitlist('11'), bitlist('0001'), bitlist('1'), bitlist('')])
+        [bitlist(), bitlist('0001'), bitlist('1'), bitlist('11')]
+        >>> bitlist.sorted([bitlist('10'), bitlist('110')], reverse=True)
+        [bitlist('110'), bitlist('10')]
+
+        This is equivalent to (but faster than) sorting using the relational
+        operators, which convert both operands on every comparison.
+
+        >>> bs = [bitlist(n, 8) for n in [7, 200, 3, 64]]
+        >>> bitlist.sorted(bs) == sorted(bs)
+        True
+        """
+        return sorted(iterable, key=int, reverse=reverse)
+
+    @staticmethod
+    def _bisect(
+            items: Sequence[bitlist], b: Union[bitlist, int],
+            lo: int, hi: Optional[int], right: bool
+        ) -> int:
+        """
+        Locate the insertion point for an instance (or integer) within a
+        sequence of instances sorted by their integer values.
+        """
+        if lo < 0:
+            raise ValueError('lower bound must be non-negative')
+
+        target = int(b)
+        hi = len(items) if hi is None else hi
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if int(items[mid]) < target or (right and int(items[mid]) == target):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    @staticmethod
+    def bisect_left(
+            items: Sequence[bitlist], b: Union[bitlist, int],
+            lo: int = 0, hi: Optional[int] = None
+        ) -> int:
+        """
+        Return the leftmost position at which an instance (or integer) could
+        be inserted into a sequence of instances sorted by their integer
+        values (such as one returned by :obj:`sorted`) without violating the
+        ordering. The optional ``lo`` and ``hi`` parameters restrict the
+        search to a subsequence, as in the built-in :obj:`bisect` module.
+
+        >>> bs = bitlist.sorted(bitlist(n) for n in [8, 3, 5, 5, 1])
+        >>> bitlist.bisect_left(bs, bitlist('0101'))
+        2
+        >>> bitlist.bisect_left(bs, 9)
+        5
+        >>> bitlist.bisect_left(bs, 5, lo=3)
+        3
+        >>> bitlist.bisect_left(bs, 5, lo=-1)
+        Traceback (most recent call last):
+          ...
+        ValueError: lower bound must be non-negative
+        """
+        return bitlist._bisect(items, b, lo, hi, False)
+
+    @staticmethod
+    def bisect_right(
+            items: Sequence[bitlist], b: Union[bitlist, int],
+            lo: int = 0, hi: Optional[int] = None
+        ) -> int:
+        """
+        Return the rightmost position at which an instance (or integer) could
+        be inserted into a sequence of instances sorted by their integer
+        values without violating the ordering. Together with
+        :obj:`bisect_left`, this can be used to find all instances that
+        represent a given integer or that fall within a range of integers.
+
+        >>> bs = bitlist.sorted(bitlist(n) for n in [8, 3, 5, 5, 1])
+        >>> bitlist.bisect_right(bs, bitlist('0101'))
+        4
+        >>> bs[bitlist.bisect_left(bs, 5):bitlist.bisect_right(bs, 5)]
+        [bitlist('101'), bitlist('101')]
+        >>> bitlist.bisect_right(bs, 0, hi=2)
+        0
+        """
+        return bitlist._bisect(items, b, lo, hi, True)
+
 if __name__ == '__main__':
+    import doctest # pragma: no cover
     doctest.testmod() # pragma: no cover
@@ -0,0 +1,228 @@
+"""
+Compiled codec for fixed-width records that consist of named bit fields.
+"""
+from __future__ import annotations
+import collections.abc
+from bitlist.bitlist import bitlist
+
+# Typing names are imported only during static analysis (as in :obj:`bitlist.bitlist`).
+TYPE_CHECKING = False
+if TYPE_CHECKING: # pragma: no cover
+    from typing import Union, Sequence, Mapping, Tuple, List, Dict
+
+class record:
+    """
+    Compiled codec for fixed-width records that consist of named bit fields.
+    The layout is supplied as a sequence of field specifications, each being
+    a tuple containing a field name, a width (in bits), and (optionally) a
+    boolean indicating whether the field holds a signed (two's complement)
+    integer. The first field occupies the most significant (*i.e.*, leftmost)
+    bits of the record, mirroring the order used by :obj:`bitlist.__truediv__`.
+
+    >>> r = record([('tag', 3), ('flag', 1), ('value', 4, True)])
+    >>> len(r)
+    8
+    >>> r.decode(bytes([0b10111111]))
+    (5, 1, -1)
+    >>> r.decode_dict(bitlist('10111111'))
+    {'tag': 5, 'flag': 1, 'value': -1}
+    >>> r.encode((5, 1, -1))
+    bitlist('10111111')
+    >>> r.encode({'tag': 5, 'flag': 1, 'value': -1}) == r.encode((5, 1, -1))
+    True
+    >>> r.to_bytes((5, 1, -1)).hex()
+    'bf'
+
+    A buffer containing a concatenation of byte-aligned records (each
+    padded on the left to a multiple of eight bits, as with
+    :obj:`bitlist.to_bytes`) can be decoded in a single call.
+
+    >>> r.decode_all(bytes([0b10111111, 0b00010011]))
+    [(5, 1, -1), (0, 1, 3)]
+
+    The layout is validated when the codec is compiled, and values are
+    validated when they are encoded.
+
+    >>> record([])
+    Traceback (most recent call last):
+      ...
+    ValueError: layout must have at least one field
+    >>> record([('a',)])
+    Traceback (most recent call last):
+      ...
+    ValueError: field specification must have two or three entries
+    >>> record([(0, 1)])
+    Traceback (most recent call last):
+      ...
+    ValueError: field name must be a string
+    >>> record([('a', 0)])
+    Traceback (most recent call last):
+      ...
+    ValueError: field width must be a positive integer
+    >>> record([('a', 1), ('a', 2)])
+    Traceback (most recent call last):
+      ...
+    ValueError: field names must be distinct
+    >>> r.encode((8, 0, 0))
+    Traceback (most recent call last):
+      ...
+    ValueError: value for field 'tag' does not fit in 3 bits
+    >>> r.encode((0, 0))
+    Traceback (most recent call last):
+      ...
+    ValueError: number of values must match number of fields
+    >>> r.decode(bytes([1, 2]))
+    Traceback (most recent call last):
+      ...
+    ValueError: data length must match record size
+    >>> r.decode(bitlist('1'))
+    Traceback (most recent call last):
+      ...
+    ValueError: bit vector length must match record width
+    >>> r.decode_all(bytes([1, 2, 3]) * 3)[:2]
+    [(0, 0, 1), (0, 0, 2)]
+    >>> r.decode_all(bytes(3) * 3) == [(0, 0, 0)] * 9
+    True
+    >>> record([('a', 8), ('b', 8)]).decode_all(bytes([1, 2, 3, 4]))
+    [(1, 2), (3, 4)]
+    >>> record([('a', 8), ('b', 8)]).decode_all(bytes(3))
+    Traceback (most recent call last):
+      ...
+    ValueError: buffer length must be a multiple of record size
+    """
+    def __init__(
+            self: record,
+            fields: Sequence[Union[Tuple[str, int], Tuple[str, int, bool]]]
+        ):
+        """
+        Validate the layout and precompute the shift, mask, and sign
+        information for each field.
+        """
+        if len(fields) == 0:
+            raise ValueError('layout must have at least one field')
+
+        if not all(
+            isinstance(field, collections.abc.Sequence) and len(field) in (2, 3)
+            for field in fields
+        ):
+            raise ValueError('field specification must have two or three entries')
+
+        self.names: Tuple[str, ...] = tuple(field[0] for field in fields)
+        if not all(isinstance(name, str) for name in self.names):
+            raise ValueError('field name must be a string')
+
+        if len(set(self.names)) != len(self.names):
+            raise ValueError('field names must be distinct')
+
+        widths = [field[1] for field in fields]
+        if not all(isinstance(w, int) and w > 0 for w in widths):
+            raise ValueError('field width must be a positive integer')
+
+        self.length: int = sum(widths)
+        self.size: int = (self.length + 7) // 8
+
+        # Each compiled field is a tuple of the form ``(shift, mask, sign)``,
+        # where ``sign`` is the value of the sign bit (or ``0`` if unsigned).
+        self._fields: List[Tuple[int, int, int]] = []
+        shift = self.length
+        for (field, width) in zip(fields, widths):
+            shift -= width
+            signed = len(field) > 2 and bool(field[2])
+            self._fields.append((shift, (1 << width) - 1, (1 << (width - 1)) if signed else 0))
+
+        self._signed = any(sign for (_, _, sign) in self._fields)
+
+    def __len__(self: record) -> int:
+        """
+        Return the width (in bits) of a record.
+        """
+        return self.length
+
+    def _value(self: record, n: int) -> Tuple[int, ...]:
+        """
+        Decode the fields of a record represented as an integer.
+        """
+        if not self._signed:
+            return tuple((n >> shift) & mask for (shift, mask, _) in self._fields)
+
+        return tuple(
+            (v - ((mask + 1) if v & sign else 0))
+            for (shift, mask, sign) in self._fields
+            for v in ((n >> shift) & mask,)
+        )
+
+    def decode(self: record, data: Union[bytes, bytearray, bitlist]) -> Tuple[int, ...]:
+        """
+        Decode a record (supplied as a bytes-like object or as a bit vector)
+        into a tuple of integers (one for each field).
+        """
+        if isinstance(data, bitlist):
+            if len(data) != self.length:
+                raise ValueError('bit vector length must match record width')
+            return self._value(int(data))
+
+        if len(data) != self.size:
+            raise ValueError('data length must match record size')
+
+        return self._value(int.from_bytes(data, 'big'))
+
+    def decode_dict(self: record, data: Union[bytes, bytearray, bitlist]) -> Dict[str, int]:
+        """
+        Decode a record into a dictionary that maps field names to integers.
+        """
+        return dict(zip(self.names, self.decode(data)))
+
+    def decode_all(
+            self: record,
+            buffer: Union[bytes, bytearray, memoryview]
+        ) -> List[Tuple[int, ...]]:
+        """
+        Decode a buffer that consists of a concatenation of records.
+        """
+        size = self.size
+        if len(buffer) % size != 0:
+            raise ValueError('buffer length must be a multiple of record size')
+
+        view = memoryview(buffer)
+        from_bytes = int.from_bytes
+        value = self._value
+        return [value(from_bytes(view[i:i + size], 'big')) for i in range(0, len(view), size)]
+
+    def _int(self: record, values: Union[Sequence[int], Mapping[str, int]]) -> int:
+        """
+        Encode a collection of field values as an integer.
+        """
+        if isinstance(values, collections.abc.Mapping):
+            values = [values[name] for name in self.names]
+
+        if len(values) != len(self._fields):
+            raise ValueError('number of values must match number of fields')
+
+        n = 0
+        for (name, v, (shift, mask, sign)) in zip(self.names, values, self._fields):
+            if not -sign <= v < (sign or (mask + 1)):
+                raise ValueError(
+                    'value for field ' + repr(name) + ' does not fit in ' +
+                    str(mask.bit_length()) + ' bits'
+                )
+            n |= (v & mask) << shift
+
+        return n
+
+    def encode(self: record, values: Union[Sequence[int], Mapping[str, int]]) -> bitlist:
+        """
+        Encode a sequence of field values (or a mapping from field names
+        to values) as a bit vector.
+        """
+        return bitlist(self._int(values), self.length)
+
+    def to_bytes(self: record, values: Union[Sequence[int], Mapping[str, int]]) -> bytes:
+        """
+        Encode a sequence of field values (or a mapping from field names
+        to values) as a bytes-like object.
+        """
+        return self._int(values).to_bytes(self.size, 'big')
+
+if __name__ == '__main__':
+    import doctest # pragma: no cover
+    doctest.testmod() # pragma: no cover
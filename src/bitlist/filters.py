@@ -0,0 +1,245 @@
+"""
+Bloom filter backed by a bit vector.
+"""
+from __future__ import annotations
+from bitlist.bitlist import bitlist
+
+# Typing names are imported only during static analysis (as in :obj:`bitlist.bitlist`).
+TYPE_CHECKING = False
+if TYPE_CHECKING: # pragma: no cover
+    from typing import Union, Optional, Iterable, List, Callable
+
+def _hash(key: bytes) -> int:
+    """
+    Default hash function for :obj:`bloom` instances (returning a 128-bit
+    integer).
+    """
+    import hashlib # pylint: disable=import-outside-toplevel
+    return int.from_bytes(hashlib.blake2b(key, digest_size=16).digest(), 'little')
+
+class bloom:
+    """
+    Bloom filter backed by a :obj:`bitlist` instance. The ``size`` parameter
+    specifies the number of bits and the ``hashes`` parameter specifies the
+    number of bit positions that correspond to each key. Keys must be strings
+    or bytes-like objects.
+
+    >>> f = bloom(1024, 3)
+    >>> f.add('abc')
+    >>> f.add_many([b'xyz', 'uvw'])
+    >>> 'abc' in f, b'xyz' in f, 'uvw' in f
+    (True, True, True)
+    >>> 'def' in f
+    False
+    >>> f.contains_many(['abc', 'def'])
+    [True, False]
+    >>> f.bitlist.count() <= 9
+    True
+
+    If the ``block`` parameter is supplied, a blocked variant is used: the
+    bits are partitioned into blocks of the specified size (*e.g.*, ``512``
+    bits for a typical cache line) and all positions for a key fall within
+    a single block.
+
+    >>> f = bloom(4096, 4, block=512)
+    >>> f.add_many(str(i) for i in range(100))
+    >>> all(f.contains_many(str(i) for i in range(100)))
+    True
+    >>> ps = f.positions('abc')
+    >>> len(set(p // 512 for p in ps))
+    1
+
+    A hash function can be supplied via the ``function`` parameter. It must
+    accept a bytes-like object and return a non-negative integer of at least
+    128 bits (the first half of which is used to select the block in the
+    blocked variant).
+
+    >>> import hashlib
+    >>> sha = lambda k: int.from_bytes(hashlib.sha256(k).digest(), 'big')
+    >>> f = bloom(1024, 3, function=sha)
+    >>> f.add('abc')
+    >>> ('abc' in f, 'def' in f)
+    (True, False)
+
+    Filters that have identical parameters can be combined using the union and
+    intersection operators (which are applied to the underlying bit vectors).
+
+    >>> (f, g) = (bloom(256, 2), bloom(256, 2))
+    >>> f.add('abc')
+    >>> g.add('xyz')
+    >>> ('abc' in (f | g), 'xyz' in (f | g))
+    (True, True)
+    >>> ('abc' in (f & g), 'xyz' in (f & g))
+    (False, False)
+    >>> f | bloom(256, 3)
+    Traceback (most recent call last):
+      ...
+    ValueError: filters must have identical parameters
+
+    The underlying bits can be serialized and deserialized.
+
+    >>> h = bloom.from_bytes(f.to_bytes(), 256, 2)
+    >>> ('abc' in h, 'xyz' in h)
+    (True, False)
+    >>> h.bitlist == f.bitlist
+    True
+
+    The underlying bit vector can also be replaced directly.
+
+    >>> h.bitlist = bitlist(0, h.size)
+    >>> 'abc' in h
+    False
+
+    Any attempt to create an instance using invalid parameters raises an
+    exception.
+
+    >>> bloom(0)
+    Traceback (most recent call last):
+      ...
+    ValueError: size must be a positive integer
+    >>> bloom(100, 0)
+    Traceback (most recent call last):
+      ...
+    ValueError: number of hashes must be a positive integer
+    >>> bloom(1000, 2, block=0)
+    Traceback (most recent call last):
+      ...
+    ValueError: block size must be a positive integer
+    >>> bloom(1024, 2, block=2.0)
+    Traceback (most recent call last):
+      ...
+    ValueError: block size must be a positive integer
+    >>> bloom(1000, 2, block=512)
+    Traceback (most recent call last):
+      ...
+    ValueError: size must be a multiple of the block size
+    >>> 123 in bloom(8)
+    Traceback (most recent call last):
+      ...
+    TypeError: key must be a string or bytes-like object
+    """
+    def __init__(
+            self: bloom,
+            size: int,
+            hashes: int = 4,
+            block: Optional[int] = None,
+            function: Optional[Callable[[bytes], int]] = None
+        ):
+        """
+        Validate the parameters and allocate the underlying bit vector.
+        """
+        if not isinstance(size, int) or size <= 0:
+            raise ValueError('size must be a positive integer')
+
+        if not isinstance(hashes, int) or hashes <= 0:
+            raise ValueError('number of hashes must be a positive integer')
+
+        if block is not None:
+            if not isinstance(block, int) or block <= 0:
+                raise ValueError('block size must be a positive integer')
+
+            if size % block != 0:
+                raise ValueError('size must be a multiple of the block size')
+
+        self.size: int = size
+        self.hashes: int = hashes
+        self.block: Optional[int] = block
+        self.function: Callable[[bytes], int] = _hash if function is None else function
+        self.bitlist: bitlist = bitlist(0, size)
+
+    @staticmethod
+    def from_bytes(
+            data: Union[bytes, bytearray],
+            size: int,
+            hashes: int = 4,
+            block: Optional[int] = None,
+            function: Optional[Callable[[bytes], int]] = None
+        ) -> bloom:
+        """
+        Build an instance that has the specified parameters from the
+        serialized representation of its bit vector.
+        """
+        f = bloom(size, hashes, block, function)
+        f.bitlist = bitlist(data, size)
+        return f
+
+    def to_bytes(self: bloom) -> bytes:
+        """
+        Return a serialized representation of the underlying bit vector.
+        """
+        return self.bitlist.to_bytes()
+
+    def positions(self: bloom, key: Union[str, bytes, bytearray]) -> List[int]:
+        """
+        Return the positions of the bits that correspond to the supplied key
+        (using double hashing to derive all positions from one hash value).
+        """
+        if isinstance(key, str):
+            key = key.encode('utf8')
+        elif not isinstance(key, (bytes, bytearray)):
+            raise TypeError('key must be a string or bytes-like object')
+
+        h = self.function(key)
+        if self.block is None:
+            (h1, h2, size) = (h & 0xffffffffffffffff, (h >> 64) | 1, self.size)
+            return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+        (block, base) = (self.block, ((h & 0xffffffffffffffff) % (self.size // self.block)))
+        (h1, h2) = ((h >> 64) & 0xffffffff, (h >> 96) | 1)
+        return [(base * block) + ((h1 + i * h2) % block) for i in range(self.hashes)]
+
+    def add(self: bloom, key: Union[str, bytes, bytearray]):
+        """
+        Insert a key into this filter.
+        """
+        self.bitlist.set_many(self.positions(key))
+
+    def add_many(self: bloom, keys: Iterable[Union[str, bytes, bytearray]]):
+        """
+        Insert all keys in the supplied iterable into this filter.
+        """
+        positions = self.positions
+        self.bitlist.set_many([p for key in keys for p in positions(key)])
+
+    def __contains__(self: bloom, key: Union[str, bytes, bytearray]) -> bool:
+        """
+        Determine whether a key may have been inserted into this filter.
+        """
+        return all(self.bitlist.get_many(self.positions(key)))
+
+    def contains_many(self: bloom, keys: Iterable[Union[str, bytes, bytearray]]) -> List[bool]:
+        """
+        Determine for each key in the supplied iterable whether it may have
+        been inserted into this filter.
+        """
+        (get_many, positions) = (self.bitlist.get_many, self.positions)
+        return [all(get_many(positions(key))) for key in keys]
+
+    def _combine(self: bloom, other: bloom, vector: bitlist) -> bloom:
+        """
+        Build a filter that has the parameters of this filter and the
+        supplied bit vector (after confirming that parameters match).
+        """
+        if (self.size, self.hashes, self.block, self.function) != \
+           (other.size, other.hashes, other.block, other.function):
+            raise ValueError('filters must have identical parameters')
+
+        f = bloom(self.size, self.hashes, self.block, self.function)
+        f.bitlist = vector
+        return f
+
+    def __or__(self: bloom, other: bloom) -> bloom:
+        """
+        Return the union of two filters.
+        """
+        return self._combine(other, self.bitlist | other.bitlist)
+
+    def __and__(self: bloom, other: bloom) -> bloom:
+        """
+        Return the intersection of two filters.
+        """
+        return self._combine(other, self.bitlist & other.bitlist)
+
+if __name__ == '__main__':
+    import doctest # pragma: no cover
+    doctest.testmod() # pragma: no cover
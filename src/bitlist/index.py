@@ -0,0 +1,251 @@
+"""
+Index for retrieving bit vectors by Hamming distance.
+"""
+from __future__ import annotations
+import itertools
+import heapq
+from bitlist.bitlist import bitlist, _weight
+
+# Typing names are imported only during static analysis (as in :obj:`bitlist.bitlist`).
+TYPE_CHECKING = False
+if TYPE_CHECKING: # pragma: no cover
+    from typing import Optional, Iterable, Iterator, Tuple, List, Dict
+
+def _comb(n: int, k: int) -> int:
+    """
+    Return the binomial coefficient for the supplied arguments.
+    """
+    r = 1
+    for i in range(min(k, n - k)):
+        r = (r * (n - i)) // (i + 1)
+    return r
+
+class bitindex:
+    """
+    Index over a collection of bit vectors of equal length that supports
+    efficient retrieval of all stored bit vectors within a given Hamming
+    distance of a query, as well as retrieval of the nearest stored bit
+    vectors. The index uses multi-index hashing: each bit vector is split
+    into ``chunks`` disjoint substrings, and each substring is stored in its
+    own hash table. By the pigeonhole principle, any bit vector within
+    distance ``r`` of a query matches the query on at least one substring
+    within distance ``r // chunks``, so only those table entries (rather
+    than all stored bit vectors) must be examined.
+
+    >>> i = bitindex(8, chunks=2)
+    >>> i.add(bitlist('00001111'))
+    0
+    >>> i.add(bitlist('00001110'))
+    1
+    >>> i.add(bitlist('11110000'))
+    2
+    >>> len(i)
+    3
+    >>> i[2]
+    bitlist('11110000')
+
+    Query results consist of pairs that contain the position of a stored
+    bit vector and its distance from the query (sorted by distance and then
+    by position).
+
+    >>> i.within(bitlist('00001111'), 1)
+    [(0, 0), (1, 1)]
+    >>> i.within(bitlist('11111111'), 3)
+    []
+    >>> i.within(bitlist('11111111'), 4)
+    [(0, 4), (2, 4)]
+    >>> i.nearest(bitlist('00000110'), 2)
+    [(1, 1), (0, 2)]
+    >>> i.nearest(bitlist('11100000'))
+    [(2, 1)]
+
+    The results of queries match those of an exhaustive search.
+
+    >>> import random
+    >>> random.seed(0)
+    >>> bs = [bitlist(random.getrandbits(32), 32) for _ in range(200)]
+    >>> i = bitindex(32, items=bs)
+    >>> q = bitlist(random.getrandbits(32), 32)
+    >>> ds = sorted((q.hamming(b), j) for (j, b) in enumerate(bs))
+    >>> i.within(q, 10) == [(j, d) for (d, j) in ds if d <= 10]
+    True
+    >>> i.nearest(q, 5) == [(j, d) for (d, j) in ds[:5]]
+    True
+    >>> i.nearest(q, 300) == [(j, d) for (d, j) in ds]
+    True
+    >>> i.within(q, -1), i.nearest(q, 0)
+    ([], [])
+
+    Only bit vectors that have the length specified for the index can be
+    stored or used as queries.
+
+    >>> i.add(bitlist('1'))
+    Traceback (most recent call last):
+      ...
+    ValueError: bit vector length must match index length
+    >>> bitindex(8, chunks=9)
+    Traceback (most recent call last):
+      ...
+    ValueError: number of chunks must be a positive integer not exceeding length
+    """
+    def __init__(
+            self: bitindex,
+            length: int,
+            chunks: Optional[int] = None,
+            items: Iterable[bitlist] = ()
+        ):
+        """
+        Compute the chunk boundaries and add any supplied bit vectors.
+        """
+        chunks = max(1, length // 16) if chunks is None else chunks
+        if not isinstance(chunks, int) or not 0 < chunks <= length:
+            raise ValueError('number of chunks must be a positive integer not exceeding length')
+
+        self.length: int = length
+
+        # Each chunk is represented by its ``(shift, width)`` pair.
+        self._chunks: List[Tuple[int, int]] = []
+        shift = length
+        for c in range(chunks):
+            width = (length // chunks) + (1 if c < length % chunks else 0)
+            shift -= width
+            self._chunks.append((shift, width))
+
+        self._codes: List[int] = []
+        self._tables: List[Dict[int, List[int]]] = [{} for _ in range(chunks)]
+        self._masks: Dict[Tuple[int, int], List[int]] = {}
+
+        for b in items:
+            self.add(b)
+
+    def __len__(self: bitindex) -> int:
+        """
+        Return the number of bit vectors stored in the index.
+        """
+        return len(self._codes)
+
+    def __getitem__(self: bitindex, position: int) -> bitlist:
+        """
+        Return the bit vector stored at the specified position.
+        """
+        return bitlist(self._codes[position], self.length)
+
+    def _code(self: bitindex, b: bitlist) -> int:
+        """
+        Return the integer corresponding to a bit vector of the correct length.
+        """
+        if len(b) != self.length:
+            raise ValueError('bit vector length must match index length')
+
+        return int(b)
+
+    def add(self: bitindex, b: bitlist) -> int:
+        """
+        Add a bit vector to the index and return its position.
+        """
+        code = self._code(b)
+        position = len(self._codes)
+        self._codes.append(code)
+        for ((shift, width), table) in zip(self._chunks, self._tables):
+            table.setdefault((code >> shift) & ((1 << width) - 1), []).append(position)
+
+        return position
+
+    def _neighbors(self: bitindex, width: int, distance: int) -> List[int]:
+        """
+        Return (and cache) all masks of the specified width that have exactly
+        the specified number of ones.
+        """
+        key = (width, distance)
+        if key not in self._masks:
+            self._masks[key] = [
+                sum(1 << i for i in ones)
+                for ones in itertools.combinations(range(width), distance)
+            ]
+        return self._masks[key]
+
+    def _probe(self: bitindex, code: int, distance: int) -> Iterator[int]:
+        """
+        Yield the positions of all stored bit vectors that have at least one
+        chunk at exactly the specified distance from the corresponding chunk
+        of the supplied code.
+        """
+        for ((shift, width), table) in zip(self._chunks, self._tables):
+            if distance <= width:
+                chunk = (code >> shift) & ((1 << width) - 1)
+                for mask in self._neighbors(width, distance):
+                    yield from table.get(chunk ^ mask, ())
+
+    def _cost(self: bitindex, distance: int) -> int:
+        """
+        Return the number of table lookups required to probe all chunks
+        at exactly the specified distance.
+        """
+        return sum(
+            _comb(width, distance)
+            for (_, width) in self._chunks
+            if distance <= width
+        )
+
+    def _scan(self: bitindex, code: int) -> List[Tuple[int, int]]:
+        """
+        Return the distances to all stored bit vectors via exhaustive search.
+        """
+        return [(_weight(code ^ c), j) for (j, c) in enumerate(self._codes)]
+
+    def within(self: bitindex, b: bitlist, radius: int) -> List[Tuple[int, int]]:
+        """
+        Return the positions and distances of all stored bit vectors that are
+        within the specified Hamming distance of the supplied bit vector.
+        """
+        code = self._code(b)
+        if radius < 0:
+            return []
+
+        level = radius // len(self._chunks)
+
+        if sum(self._cost(d) for d in range(level + 1)) >= len(self._codes):
+            found = [(d, j) for (d, j) in self._scan(code) if d <= radius]
+        else:
+            positions = set()
+            for d in range(level + 1):
+                positions.update(self._probe(code, d))
+            found = [(_weight(code ^ self._codes[j]), j) for j in positions]
+            found = [(d, j) for (d, j) in found if d <= radius]
+
+        return [(j, d) for (d, j) in sorted(found)]
+
+    def nearest(self: bitindex, b: bitlist, count: int = 1) -> List[Tuple[int, int]]:
+        """
+        Return the positions and distances of the specified number of stored
+        bit vectors that are nearest to the supplied bit vector (with ties
+        broken by position).
+        """
+        code = self._code(b)
+        if count <= 0:
+            return []
+
+        found: Dict[int, int] = {}
+        (cost, level) = (0, 0)
+        while count < len(self._codes):
+            cost += self._cost(level)
+            if cost >= len(self._codes):
+                break # Probing is no cheaper than an exhaustive search.
+
+            for j in self._probe(code, level):
+                if j not in found:
+                    found[j] = _weight(code ^ self._codes[j])
+
+            # All stored bit vectors at distance below this bound have been found.
+            bound = len(self._chunks) * (level + 1)
+            best = heapq.nsmallest(count, ((d, j) for (j, d) in found.items()))
+            if len(best) == count and best[-1][0] < bound:
+                return [(j, d) for (d, j) in best]
+
+            level += 1
+
+        return [(j, d) for (d, j) in heapq.nsmallest(count, self._scan(code))]
+
+if __name__ == '__main__':
+    import doctest # pragma: no cover
+    doctest.testmod() # pragma: no cover
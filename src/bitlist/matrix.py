@@ -0,0 +1,399 @@
+"""
+Matrices over GF(2) with rows packed into integers.
+"""
+from __future__ import annotations
+from bitlist.bitlist import bitlist, _weight
+
+# Typing names are imported only during static analysis (as in :obj:`bitlist.bitlist`).
+TYPE_CHECKING = False
+if TYPE_CHECKING: # pragma: no cover
+    from typing import Union, Optional, Iterable, Tuple, List
+
+def _eliminate(rows: List[int], width: int, columns: int) -> List[int]:
+    """
+    Transform (in place) a list of integers that represent rows of a matrix
+    over GF(2) having the specified width into reduced row echelon form with
+    respect to the specified number of leading columns. The list of pivot
+    columns is returned, and the pivot rows appear at the beginning of the
+    list of rows (in the order of their pivots).
+    """
+    pivots = []
+    for j in range(columns):
+        r = len(pivots)
+        bit = 1 << (width - 1 - j)
+        for i in range(r, len(rows)):
+            if rows[i] & bit:
+                (rows[r], rows[i]) = (rows[i], rows[r])
+                break
+        else:
+            continue
+
+        # Clear the pivot column in all other rows (using one integer
+        # operation per row rather than one operation per bit).
+        pivot = rows[r]
+        for (i, row) in enumerate(rows):
+            if i != r and row & bit:
+                rows[i] = row ^ pivot
+        pivots.append(j)
+
+    return pivots
+
+def _format(row: int, width: int) -> str:
+    """
+    Return the binary digits of a row of the specified width as a string.
+    """
+    return format(row, '0' + str(width) + 'b') if width > 0 else ''
+
+class bitmatrix:
+    """
+    Matrix over GF(2) in which each row is packed into a single integer, so
+    that row operations act on all entries in a row at once. Rows can be
+    supplied as :obj:`bitlist` instances (or any other values accepted by the
+    :obj:`bitlist` constructor) and are retrieved as :obj:`bitlist` instances.
+
+    >>> a = bitmatrix(['110', '011', '111'])
+    >>> a
+    bitmatrix(['110', '011', '111'])
+    >>> a[0]
+    bitlist('110')
+    >>> a[2, 1]
+    1
+    >>> a[0, -1] == a[0][-1]
+    True
+    >>> (len(a), a.columns)
+    (3, 3)
+    >>> a.transpose()
+    bitmatrix(['101', '111', '011'])
+
+    Matrix-vector, vector-matrix, and matrix-matrix products are supported,
+    as is addition (which corresponds to bitwise exclusive disjunction).
+
+    >>> a @ bitlist('101')
+    bitlist('110')
+    >>> bitlist('101') @ a
+    bitlist('001')
+    >>> a @ a
+    bitmatrix(['101', '100', '010'])
+    >>> a + a
+    bitmatrix(['000', '000', '000'])
+    >>> a @ bitmatrix.identity(3) == a
+    True
+
+    Gaussian elimination is used to compute the reduced row echelon form, the
+    rank, a basis for the nullspace, the inverse, and solutions to systems of
+    linear equations.
+
+    >>> a.echelon()
+    bitmatrix(['100', '010', '001'])
+    >>> a.rank()
+    3
+    >>> a.inverse()
+    bitmatrix(['011', '111', '101'])
+    >>> a.inverse() @ a == bitmatrix.identity(3)
+    True
+    >>> x = a.solve(bitlist('010'))
+    >>> x
+    bitlist('110')
+    >>> a @ x
+    bitlist('010')
+    >>> b = bitmatrix(['1100', '0110', '1010'])
+    >>> b.rank()
+    2
+    >>> b.nullspace()
+    [bitlist('1110'), bitlist('0001')]
+    >>> all(not (b @ v) for v in b.nullspace())
+    True
+    >>> b.solve(bitlist('111'))
+    Traceback (most recent call last):
+      ...
+    ValueError: system has no solution
+    >>> b.inverse()
+    Traceback (most recent call last):
+      ...
+    ValueError: matrix is not invertible
+
+    Rows must have equal lengths, and operands must have compatible dimensions.
+
+    >>> bitmatrix(['10', '1'])
+    Traceback (most recent call last):
+      ...
+    ValueError: rows must have equal lengths
+    >>> a @ bitlist('1')
+    Traceback (most recent call last):
+      ...
+    ValueError: dimensions are not compatible
+    >>> a + b
+    Traceback (most recent call last):
+      ...
+    ValueError: dimensions are not compatible
+    >>> b @ a
+    Traceback (most recent call last):
+      ...
+    ValueError: dimensions are not compatible
+    >>> bitlist('1') @ a
+    Traceback (most recent call last):
+      ...
+    ValueError: dimensions are not compatible
+    >>> a.solve(bitlist('1'))
+    Traceback (most recent call last):
+      ...
+    ValueError: dimensions are not compatible
+    >>> bitmatrix(['11', '11']).inverse()
+    Traceback (most recent call last):
+      ...
+    ValueError: matrix is not invertible
+    >>> bitmatrix([], 2)
+    bitmatrix([], 2)
+    >>> bitmatrix([], 2).transpose()
+    bitmatrix(['', ''])
+    >>> bitmatrix(['', '']).transpose()
+    bitmatrix([], 2)
+    >>> a[0, 3]
+    Traceback (most recent call last):
+      ...
+    IndexError: bitmatrix index out of range
+
+    Operands of other types are not supported.
+
+    >>> a == None
+    False
+    >>> a @ 5
+    Traceback (most recent call last):
+      ...
+    TypeError: unsupported operand type(s) for @: 'bitmatrix' and 'int'
+    >>> 5 @ a
+    Traceback (most recent call last):
+      ...
+    TypeError: unsupported operand type(s) for @: 'int' and 'bitmatrix'
+    >>> a + 5
+    Traceback (most recent call last):
+      ...
+    TypeError: unsupported operand type(s) for +: 'bitmatrix' and 'int'
+    """
+    def __init__(
+            self: bitmatrix,
+            rows: Iterable[Union[bitlist, str, Iterable[int]]],
+            columns: Optional[int] = None
+        ):
+        """
+        Convert each row into its packed representation.
+        """
+        self._rows: List[int] = []
+        self.columns: int = 0 if columns is None else columns
+
+        for (i, row) in enumerate(rows):
+            row = row if isinstance(row, bitlist) else bitlist(row)
+            if i == 0 and columns is None:
+                self.columns = len(row)
+            if len(row) != self.columns:
+                raise ValueError('rows must have equal lengths')
+            self._rows.append(int(row))
+
+    @staticmethod
+    def _from_rows(rows: List[int], columns: int) -> bitmatrix:
+        """
+        Build an instance directly from a list of packed rows.
+        """
+        m = bitmatrix([], columns)
+        m._rows = rows # pylint: disable=protected-access
+        return m
+
+    @staticmethod
+    def identity(n: int) -> bitmatrix:
+        """
+        Return the identity matrix of the specified size.
+
+        >>> bitmatrix.identity(2)
+        bitmatrix(['10', '01'])
+        """
+        return bitmatrix._from_rows([1 << (n - 1 - i) for i in range(n)], n)
+
+    def __repr__(self: bitmatrix) -> str:
+        """
+        Return a string representation (that can also be evaluated
+        as a valid Python expression if the class is in the namespace).
+        """
+        rows = [_format(row, self.columns) for row in self._rows]
+        return \
+            'bitmatrix(' + repr(rows) + \
+            ((', ' + str(self.columns)) if len(rows) == 0 else '') + ')'
+
+    def __len__(self: bitmatrix) -> int:
+        """
+        Return the number of rows.
+        """
+        return len(self._rows)
+
+    def __getitem__(self: bitmatrix, key: Union[int, Tuple[int, int]]) -> Union[bitlist, int]:
+        """
+        Retrieve a row (as a bit vector) or an individual entry.
+        """
+        if isinstance(key, tuple):
+            (i, j) = key
+            if not -self.columns <= j < self.columns:
+                raise IndexError('bitmatrix index out of range')
+            return (self._rows[i] >> (self.columns - 1 - (j % self.columns))) & 1
+
+        return bitlist(self._rows[key], self.columns)
+
+    def __eq__(self: bitmatrix, other: bitmatrix) -> bool:
+        """
+        Determine whether two matrices have the same dimensions and entries.
+        """
+        if not isinstance(other, bitmatrix):
+            return NotImplemented
+
+        # pylint: disable=protected-access
+        return self.columns == other.columns and self._rows == other._rows
+
+    def transpose(self: bitmatrix) -> bitmatrix:
+        """
+        Return the transpose of this matrix.
+        """
+        digits = [_format(row, self.columns) for row in self._rows]
+        return bitmatrix._from_rows(
+            [int(''.join(column), 2) for column in zip(*digits)]
+            if len(digits) > 0 else [0] * self.columns,
+            len(self._rows)
+        )
+
+    def __add__(self: bitmatrix, other: bitmatrix) -> bitmatrix:
+        """
+        Return the sum of two matrices.
+        """
+        if not isinstance(other, bitmatrix):
+            return NotImplemented
+
+        # pylint: disable=protected-access
+        if self.columns != other.columns or len(self) != len(other):
+            raise ValueError('dimensions are not compatible')
+
+        return bitmatrix._from_rows(
+            [x ^ y for (x, y) in zip(self._rows, other._rows)],
+            self.columns
+        )
+
+    def __matmul__(self: bitmatrix, other: Union[bitmatrix, bitlist]) -> Union[bitmatrix, bitlist]:
+        """
+        Return the product of this matrix and a matrix or a (column) vector.
+        Matrix products use the Method of Four Russians: for every group of
+        eight rows of the right-hand operand, a table of all combinations of
+        those rows is built so that each row of the result is obtained with
+        one lookup per group.
+        """
+        if isinstance(other, bitlist):
+            if len(other) != self.columns:
+                raise ValueError('dimensions are not compatible')
+
+            x = int(other)
+            return bitlist([_weight(row & x) & 1 for row in self._rows], len(self._rows))
+
+        if not isinstance(other, bitmatrix):
+            return NotImplemented
+
+        if len(other) != self.columns:
+            raise ValueError('dimensions are not compatible')
+
+        rows = [0] * len(self._rows)
+        others = other._rows # pylint: disable=protected-access
+        for start in range(0, len(others), 8):
+            group = others[start:start + 8]
+            (size, shift) = (len(group), self.columns - start - len(group))
+
+            # Entry ``k`` of the table is the sum of the rows in the group that
+            # correspond to the bits of ``k`` (with the first row as the most
+            # significant bit).
+            table = [0] * (1 << size)
+            for k in range(1, 1 << size):
+                low = k & (-k)
+                table[k] = table[k ^ low] ^ group[size - low.bit_length()]
+
+            mask = (1 << size) - 1
+            for (i, row) in enumerate(self._rows):
+                rows[i] ^= table[(row >> shift) & mask]
+
+        return bitmatrix._from_rows(rows, other.columns)
+
+    def __rmatmul__(self: bitmatrix, other: bitlist) -> bitlist:
+        """
+        Return the product of a (row) vector and this matrix.
+        """
+        if not isinstance(other, bitlist):
+            return NotImplemented
+
+        if len(other) != len(self._rows):
+            raise ValueError('dimensions are not compatible')
+
+        r = 0
+        for (row, bit) in zip(self._rows, other):
+            if bit:
+                r ^= row
+        return bitlist(r, self.columns)
+
+    def echelon(self: bitmatrix) -> bitmatrix:
+        """
+        Return the reduced row echelon form of this matrix.
+        """
+        rows = list(self._rows)
+        _eliminate(rows, self.columns, self.columns)
+        return bitmatrix._from_rows(rows, self.columns)
+
+    def rank(self: bitmatrix) -> int:
+        """
+        Return the rank of this matrix.
+        """
+        return len(_eliminate(list(self._rows), self.columns, self.columns))
+
+    def nullspace(self: bitmatrix) -> List[bitlist]:
+        """
+        Return a basis for the nullspace of this matrix.
+        """
+        (rows, width) = (list(self._rows), self.columns)
+        pivots = _eliminate(rows, width, width)
+        basis = []
+        for j in sorted(set(range(width)) - set(pivots)):
+            bit = 1 << (width - 1 - j)
+            v = bit
+            for (row, p) in zip(rows, pivots):
+                if row & bit:
+                    v |= 1 << (width - 1 - p)
+            basis.append(bitlist(v, width))
+        return basis
+
+    def inverse(self: bitmatrix) -> bitmatrix:
+        """
+        Return the inverse of this (square) matrix.
+        """
+        n = self.columns
+        if len(self._rows) != n:
+            raise ValueError('matrix is not invertible')
+
+        rows = [(row << n) | (1 << (n - 1 - i)) for (i, row) in enumerate(self._rows)]
+        if len(_eliminate(rows, 2 * n, n)) != n:
+            raise ValueError('matrix is not invertible')
+
+        mask = (1 << n) - 1
+        return bitmatrix._from_rows([row & mask for row in rows], n)
+
+    def solve(self: bitmatrix, b: bitlist) -> bitlist:
+        """
+        Return a solution ``x`` to the equation ``self @ x == b`` (with
+        all free variables set to zero).
+        """
+        if len(b) != len(self._rows):
+            raise ValueError('dimensions are not compatible')
+
+        width = self.columns
+        rows = [(row << 1) | bit for (row, bit) in zip(self._rows, b)]
+        pivots = _eliminate(rows, width + 1, width)
+        if any(row == 1 for row in rows[len(pivots):]):
+            raise ValueError('system has no solution')
+
+        x = 0
+        for (row, p) in zip(rows, pivots):
+            x |= (row & 1) << (width - 1 - p)
+        return bitlist(x, width)
+
+if __name__ == '__main__':
+    import doctest # pragma: no cover
+    doctest.testmod() # pragma: no cover
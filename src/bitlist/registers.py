@@ -0,0 +1,331 @@
+"""
+Table-driven CRC engine and linear-feedback shift register.
+"""
+from __future__ import annotations
+from bitlist.bitlist import bitlist
+
+# Typing names are imported only during static analysis (as in :obj:`bitlist.bitlist`).
+TYPE_CHECKING = False
+if TYPE_CHECKING: # pragma: no cover
+    from typing import Union, Tuple, List, Dict, BinaryIO
+
+def _reflect(n: int, width: int) -> int:
+    """
+    Return the integer whose binary representation (of the specified
+    width) is the reverse of that of the supplied integer.
+    """
+    return int(format(n, '0' + str(width) + 'b')[::-1], 2)
+
+def _clmul(x: int, y: int) -> int:
+    """
+    Return the product of two polynomials over GF(2) that are represented
+    as integers (*i.e.*, the carry-less product of the integers).
+    """
+    r = 0
+    while y:
+        if y & 1:
+            r ^= x
+        (x, y) = (x << 1, y >> 1)
+    return r
+
+def _polymod(x: int, modulus: int) -> int:
+    """
+    Return the remainder of the division of two polynomials over GF(2)
+    that are represented as integers.
+    """
+    degree = modulus.bit_length() - 1
+    while x.bit_length() - 1 >= degree:
+        x ^= modulus << (x.bit_length() - 1 - degree)
+    return x
+
+_CRC_TABLES: Dict[Tuple[int, int, bool], List[int]] = {}
+
+class crc:
+    """
+    Table-driven CRC engine that is parameterized by the width of the checksum,
+    the generator polynomial (in normal form, *i.e.*, without the leading
+    term), the initial value, whether input bytes and the output are
+    reflected, and the value that is combined with the output via XOR. The
+    lookup table for a given configuration is computed once and is shared by
+    all instances that use that configuration.
+
+    >>> crc32 = crc(32, 0x04c11db7, 0xffffffff, True, True, 0xffffffff)
+    >>> hex(crc32.checksum(b'123456789'))
+    '0xcbf43926'
+    >>> hex(crc(16, 0x1021, 0xffff).checksum(b'123456789'))
+    '0x29b1'
+    >>> hex(crc(8, 0x07).checksum(b'123456789'))
+    '0xf4'
+    >>> hex(crc(5, 0x05, 0x1f, True, True, 0x1f).checksum(b'123456789'))
+    '0x19'
+    >>> hex(crc(3, 0x3, 0, False, False, 0x7).checksum(b'123456789'))
+    '0x4'
+    >>> hex(crc(16, 0x8005, 0, True, True).checksum(b'123456789'))
+    '0xbb3d'
+
+    Data can be supplied incrementally. Bytes-like objects, bit vectors, and
+    binary streams (*i.e.*, objects that have a ``read`` method) are accepted.
+
+    >>> c = crc32.copy()
+    >>> hex(c.update(b'1234').update(bytearray(b'56789')).value())
+    '0xcbf43926'
+    >>> import io
+    >>> hex(crc32.checksum(io.BytesIO(b'123456789')))
+    '0xcbf43926'
+    >>> hex(c.reset().update(memoryview(b'123456789')).value())
+    '0xcbf43926'
+
+    A bit vector is treated as a sequence of bits in the order in which they
+    are processed. Thus, its length need not be a multiple of eight. For an
+    engine that does not reflect its input, each byte is processed starting
+    with its most significant bit. For an engine that does reflect its input,
+    each byte is processed starting with its least significant bit.
+
+    >>> b = bitlist(b'123456789', order='little')
+    >>> hex(crc32.copy().update(b[:13]).update(b[13:]).value())
+    '0xcbf43926'
+    >>> crc16 = crc(16, 0x1021, 0xffff)
+    >>> b = bitlist(b'123456789')
+    >>> hex(crc16.copy().update(b[:3]).update(b[3:70]).update(b[70:]).value())
+    '0x29b1'
+    >>> hex(crc(3, 0x3, 0, False, False, 0x7).checksum(b))
+    '0x4'
+
+    Any attempt to create an instance using invalid parameters raises an
+    exception.
+
+    >>> crc(0, 1)
+    Traceback (most recent call last):
+      ...
+    ValueError: width must be a positive integer
+    >>> crc(8, 256)
+    Traceback (most recent call last):
+      ...
+    ValueError: polynomial must be a non-negative integer that fits within the width
+    >>> crc(8, 7, init=0x1ff)
+    Traceback (most recent call last):
+      ...
+    ValueError: init must be a non-negative integer that fits within the width
+    >>> crc(8, 7, reflect_in=True, xor_out=-1)
+    Traceback (most recent call last):
+      ...
+    ValueError: xor_out must be a non-negative integer that fits within the width
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__( # pylint: disable=too-many-arguments
+            self: crc,
+            width: int,
+            polynomial: int,
+            init: int = 0,
+            reflect_in: bool = False,
+            reflect_out: bool = False,
+            xor_out: int = 0
+        ):
+        """
+        Validate the parameters and retrieve (or build) the lookup table.
+        """
+        if not isinstance(width, int) or width <= 0:
+            raise ValueError('width must be a positive integer')
+
+        for (name, value) in (('polynomial', polynomial), ('init', init), ('xor_out', xor_out)):
+            if not isinstance(value, int) or not 0 <= value < (1 << width):
+                raise ValueError(
+                    name + ' must be a non-negative integer that fits within the width'
+                )
+
+        (self.width, self.polynomial, self.init) = (width, polynomial, init)
+        (self.reflect_in, self.reflect_out, self.xor_out) = (reflect_in, reflect_out, xor_out)
+
+        # A non-reflected register narrower than a byte is aligned to the left
+        # of a byte-wide register so that whole bytes can be processed at once.
+        self._shift = 0 if reflect_in else max(0, 8 - width)
+        self._top = width + self._shift - 1 # Index of most significant bit.
+        self._poly = \
+            _reflect(polynomial, width) if reflect_in else (polynomial << self._shift)
+
+        key = (width, polynomial, reflect_in)
+        if key not in _CRC_TABLES:
+            _CRC_TABLES[key] = [
+                self._bits(i if reflect_in else (i << (self._top - 7)), 8)
+                for i in range(256)
+            ]
+        self._table = _CRC_TABLES[key]
+
+        self.register = 0
+        self.reset()
+
+    def _bits(self: crc, register: int, count: int) -> int:
+        """
+        Advance the register by the specified number of bits (assuming the
+        input bits have already been combined with the register).
+        """
+        if self.reflect_in:
+            for _ in range(count):
+                register = (register >> 1) ^ self._poly if register & 1 else register >> 1
+            return register
+
+        (top, mask) = (1 << self._top, (2 << self._top) - 1)
+        for _ in range(count):
+            register = ((register << 1) ^ self._poly) if register & top else (register << 1)
+        return register & mask
+
+    def reset(self: crc) -> crc:
+        """
+        Restore the register of this instance to its initial value.
+        """
+        self.register = \
+            _reflect(self.init, self.width) if self.reflect_in else (self.init << self._shift)
+        return self
+
+    def copy(self: crc) -> crc:
+        """
+        Return a copy of this instance (including the current register value).
+        """
+        c = crc.__new__(crc)
+        c.__dict__.update(self.__dict__)
+        return c
+
+    def _update_bytes(self: crc, data: Union[bytes, bytearray, memoryview]):
+        """
+        Process a bytes-like object using the lookup table.
+        """
+        (table, register) = (self._table, self.register)
+        if self.reflect_in:
+            for byte in data:
+                register = table[(register ^ byte) & 255] ^ (register >> 8)
+        else:
+            (mask, shift) = ((2 << self._top) - 1, self._top - 7)
+            for byte in data:
+                register = ((register << 8) & mask) ^ table[(register >> shift) ^ byte]
+        self.register = register
+
+    def update(self: crc, data: Union[bytes, bytearray, memoryview, bitlist, BinaryIO]) -> crc:
+        """
+        Process the supplied data and return this instance.
+        """
+        if isinstance(data, bitlist):
+            whole = len(data) - (len(data) % 8)
+            order = 'little' if self.reflect_in else 'big'
+            self._update_bytes(data[:whole].to_bytes(order) if whole > 0 else b'')
+            shift = 0 if self.reflect_in else self._top
+            for bit in (data[whole:] if whole < len(data) else ()):
+                self.register = self._bits(self.register ^ (bit << shift), 1)
+        elif hasattr(data, 'read'):
+            chunk = data.read(65536)
+            while len(chunk) > 0:
+                self._update_bytes(chunk)
+                chunk = data.read(65536)
+        else:
+            self._update_bytes(data)
+
+        return self
+
+    def value(self: crc) -> int:
+        """
+        Return the checksum corresponding to all data processed so far.
+        """
+        register = self.register >> self._shift
+        if self.reflect_in != self.reflect_out:
+            register = _reflect(register, self.width)
+        return register ^ self.xor_out
+
+    def checksum(self: crc, data: Union[bytes, bytearray, memoryview, bitlist, BinaryIO]) -> int:
+        """
+        Return the checksum of the supplied data (without modifying the
+        register of this instance).
+        """
+        return self.copy().reset().update(data).value()
+
+class lfsr:
+    """
+    Galois linear-feedback shift register of the specified width with the
+    specified feedback polynomial (in normal form, *i.e.*, without the
+    leading term). The register state is interpreted as a polynomial over
+    GF(2), so each step corresponds to multiplication by ``x`` modulo the
+    feedback polynomial. This makes it possible to advance the register by
+    any number of steps efficiently.
+
+    >>> r = lfsr(4, 0b0011, 0b0001)
+    >>> r.bits(15)
+    bitlist('000100110101111')
+    >>> r.state
+    1
+    >>> s = lfsr(4, 0b0011, 0b0001)
+    >>> r.bits(5) == s.jump(15).bits(5)
+    True
+    >>> t = lfsr(64, 0x1b, 1)
+    >>> u = t.copy()
+    >>> _ = t.bits(1000)
+    >>> u.jump(1000).state == t.state
+    True
+    >>> u.jump(0).state == t.state
+    True
+    >>> lfsr(4, 16)
+    Traceback (most recent call last):
+      ...
+    ValueError: polynomial must be a non-negative integer that fits within the width
+    >>> lfsr(0, 0)
+    Traceback (most recent call last):
+      ...
+    ValueError: width must be a positive integer
+    >>> lfsr(4, 3, 16)
+    Traceback (most recent call last):
+      ...
+    ValueError: state must be a non-negative integer that fits within the width
+    """
+    def __init__(self: lfsr, width: int, polynomial: int, state: int = 1):
+        """
+        Validate the parameters and set the initial state.
+        """
+        if not isinstance(width, int) or width <= 0:
+            raise ValueError('width must be a positive integer')
+
+        for (name, value) in (('polynomial', polynomial), ('state', state)):
+            if not isinstance(value, int) or not 0 <= value < (1 << width):
+                raise ValueError(
+                    name + ' must be a non-negative integer that fits within the width'
+                )
+
+        (self.width, self.polynomial, self.state) = (width, polynomial, state)
+        self._modulus = (1 << width) | polynomial
+
+    def copy(self: lfsr) -> lfsr:
+        """
+        Return a copy of this register.
+        """
+        return lfsr(self.width, self.polynomial, self.state)
+
+    def step(self: lfsr) -> int:
+        """
+        Advance the register by one step and return the output bit.
+        """
+        bit = (self.state >> (self.width - 1)) & 1
+        self.state = ((self.state << 1) & ((1 << self.width) - 1)) ^ \
+            (self.polynomial if bit else 0)
+        return bit
+
+    def bits(self: lfsr, count: int) -> bitlist:
+        """
+        Advance the register by the specified number of steps and return
+        the output bits.
+        """
+        return bitlist([self.step() for _ in range(count)])
+
+    def jump(self: lfsr, count: int) -> lfsr:
+        """
+        Advance the register by the specified number of steps (using
+        square-and-multiply exponentiation of ``x`` modulo the feedback
+        polynomial) and return this register.
+        """
+        (power, base) = (1, 2)
+        while count > 0:
+            if count & 1:
+                power = _polymod(_clmul(power, base), self._modulus)
+            (base, count) = (_polymod(_clmul(base, base), self._modulus), count >> 1)
+
+        self.state = _polymod(_clmul(self.state, power), self._modulus)
+        return self
+
+if __name__ == '__main__':
+    import doctest # pragma: no cover
+    doctest.testmod() # pragma: no cover
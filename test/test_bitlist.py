@@ -7,15 +7,24 @@ To view the source code of an example function, click its **[source]** link.
 """
 from __future__ import annotations
 import doctest
+import random
+import bisect
+import sys
+import os
+import subprocess
 from unittest import TestCase
 
 try:
-    from bitlist import bitlist
+    from bitlist import bitlist, record, bitindex, bloom, crc, bitmatrix
 except: # pylint: disable=bare-except
     # Support validation of docstrings in this script via its direct execution.
-    import sys
     sys.path.append('./bitlist')
     from bitlist.bitlist import bitlist
+    from bitlist.fields import record
+    from bitlist.index import bitindex
+    from bitlist.filters import bloom
+    from bitlist.registers import crc
+    from bitlist.matrix import bitmatrix
 
 def add(x: bitlist, y: bitlist) -> bitlist:
     """
@@ -92,6 +101,29 @@ def div(x: bitlist, y: bitlist) -> bitlist:
 
     return q
 
+def crc_bitwise( # pylint: disable=too-many-arguments
+        data: bitlist, width: int, polynomial: int,
+        init: int, reflect_out: bool, xor_out: int
+    ) -> int:
+    """
+    Bitwise CRC algorithm (processing the bits of a bit vector in order).
+
+    >>> hex(crc_bitwise(bitlist(b'123456789'), 16, 0x1021, 0xffff, False, 0))
+    '0x29b1'
+    """
+    r: bitlist = bitlist(init, width)
+    p: bitlist = bitlist(polynomial, width)
+    for bit in data:
+        carry = r[0] ^ bit
+        r = (r << 1)[1:]
+        if carry:
+            r = r ^ p
+
+    if reflect_out:
+        r = bitlist(list(reversed(r)))
+
+    return int(r) ^ xor_out
+
 class Test_bitlist(TestCase):
     """
     Tests of algorithms for bitwise operations.
@@ -125,5 +157,175 @@ class Test_bitlist(TestCase):
         for (x, y) in [(a//b, op(a, b)) for a in range(0, 12) for b in range(1, 12)]:
             self.assertEqual(x, y)
 
+    def test_record(self):
+        """Test encoding and decoding of records."""
+        r = record([('a', 5), ('b', 7, True), ('c', 4)])
+        for (a, b, c) in [(a, b, c) for a in (0, 17, 31) for b in range(-64, 64) for c in (0, 9)]:
+            self.assertEqual(r.decode(r.to_bytes((a, b, c))), (a, b, c))
+            self.assertEqual(r.decode(r.encode((a, b, c))), (a, b, c))
+            self.assertEqual(
+                r.encode((a, b, c)) / [5, 7, 4],
+                [bitlist(a, 5), bitlist(b % 128, 7), bitlist(c, 4)]
+            )
+
+    def test_bitindex(self):
+        """Test Hamming distance queries against an exhaustive search."""
+        random.seed(0)
+        bs = [bitlist(random.getrandbits(64), 64) for _ in range(500)]
+        bs = bs + [b ^ bitlist(1 << random.randrange(64), 64) for b in bs[:100]]
+        index = bitindex(64, chunks=8, items=bs)
+        for q in bs[:20] + [bitlist(random.getrandbits(64), 64) for _ in range(5)]:
+            ds = sorted((q.hamming(b), j) for (j, b) in enumerate(bs))
+            for radius in range(0, 10):
+                self.assertEqual(
+                    index.within(q, radius),
+                    [(j, d) for (d, j) in ds if d <= radius]
+                )
+            for count in range(1, 6):
+                self.assertEqual(index.nearest(q, count), [(j, d) for (d, j) in ds[:count]])
+
+    def test_bloom(self):
+        """Test Bloom filter membership and false positive rates."""
+        for block in (None, 512):
+            f = bloom(16384, 7, block=block)
+            f.add_many(str(i) for i in range(1000))
+            self.assertTrue(all(f.contains_many(str(i) for i in range(1000))))
+            self.assertLess(sum(f.contains_many(str(-i) for i in range(1, 1001))), 50)
+
+    def test_crc(self):
+        """Test CRC engines against a bitwise algorithm."""
+        random.seed(0)
+        for _ in range(200):
+            width = random.randint(1, 40)
+            (polynomial, init, xor_out) = [random.getrandbits(width) for _ in range(3)]
+            (reflect_in, reflect_out) = (random.random() < 0.5, random.random() < 0.5)
+            data = bytes(random.getrandbits(8) for _ in range(random.randint(0, 20)))
+            bits = bitlist(data, order='little' if reflect_in else 'big')
+            bits = bits + bitlist(random.getrandbits(5), 5) # Partial byte.
+            c = crc(width, polynomial, init, reflect_in, reflect_out, xor_out)
+            self.assertEqual(
+                c.checksum(bits),
+                crc_bitwise(bits, width, polynomial, init, reflect_out, xor_out)
+            )
+
+    def test_bitmatrix(self):
+        """Test matrix operations over GF(2)."""
+        random.seed(0)
+        for _ in range(20):
+            (r, k, c) = [random.randint(1, 20) for _ in range(3)]
+            a = bitmatrix([bitlist(random.getrandbits(k), k) for _ in range(r)])
+            b = bitmatrix([bitlist(random.getrandbits(c), c) for _ in range(k)])
+            self.assertEqual(
+                a @ b,
+                bitmatrix([
+                    [sum(a[i, j] & b[j, l] for j in range(k)) % 2 for l in range(c)]
+                    for i in range(r)
+                ])
+            )
+            self.assertEqual((a @ b).transpose(), b.transpose() @ a.transpose())
+            self.assertEqual(a.rank() + len(a.nullspace()), k)
+            self.assertTrue(all(not a @ v for v in a.nullspace()))
+            x = bitlist(random.getrandbits(k), k)
+            self.assertEqual(a @ a.solve(a @ x), a @ x)
+            if a.rank() == r == k:
+                self.assertEqual(a @ a.inverse(), bitmatrix.identity(k))
+
+    def test_import(self):
+        """Test that importing the library is fast and loads only necessary modules."""
+        # The :obj:`site` module is disabled (via ``-S``) so that no startup hooks
+        # (such as those installed by coverage tools) are run by the child process.
+        # The :obj:`collections` module is imported first because its import time
+        # serves as a baseline that is independent of the speed of the machine.
+        script = 'import sys, collections, bitlist; print(\' \'.join(sorted(sys.modules)))'
+        result = subprocess.run(
+            [sys.executable, '-S', '-X', 'importtime', '-c', script],
+            capture_output=True, text=True, check=True,
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        )
+        modules = result.stdout.split()
+        self.assertIn('bitlist.bitlist', modules)
+        for module in (
+                'doctest', 'parts', 'hashlib', 'heapq', 'typing', 'unittest',
+                'bitlist.fields', 'bitlist.index', 'bitlist.filters',
+                'bitlist.registers', 'bitlist.matrix'
+            ):
+            self.assertNotIn(module, modules)
+
+        # The cumulative import time (in microseconds) is the second column. The
+        # package itself should add little to the time taken by the core module.
+        times = {
+            t[2].strip(): int(t[1])
+            for t in [line.split('|') for line in result.stderr.splitlines()]
+            if len(t) == 3 and t[1].strip().isdigit()
+        }
+        self.assertLess(times['bitlist.bitlist'], 20 * times['collections'])
+        self.assertLess(times['bitlist'], 2 * times['bitlist.bitlist'])
+
+        # The classes in the other modules are imported when they are accessed.
+        package = sys.modules['bitlist']
+        self.assertIs(package.record, record)
+        with self.assertRaises(AttributeError):
+            package.missing # pylint: disable=pointless-statement
+
+    def test_setitem_slice(self):
+        """Test slice assignment, filling, and flipping against lists of bits."""
+        random.seed(0)
+        for _ in range(2000):
+            (x, length) = (random.getrandbits(6), random.randint(0, 12))
+            (b, bs) = (bitlist(x, length), list(bitlist(x, length)) if length > 0 else [])
+            (i, j) = (random.randint(-14, 14), random.choice([None, random.randint(-14, 14)]))
+            step = random.choice([None, 1, 2, -1, -3])
+            if random.random() < 0.5:
+                v = random.randint(0, 1)
+                bs[i:j:step] = [v] * len(bs[i:j:step])
+            else:
+                size = len(bs[i:j:step])
+                if step in (None, 1):
+                    size = random.randint(0, 4)
+                v = bitlist(random.getrandbits(4), size)
+                bs[i:j:step] = list(v) if size > 0 else []
+            b[i:j:step] = v
+            self.assertEqual((len(b), list(b)), (len(bs), bs))
+
+            if step is None:
+                b.flip(i, j)
+                bs[i:j] = [1 - bit for bit in bs[i:j]]
+                self.assertEqual((len(b), list(b)), (len(bs), bs))
+
+    def test_set_many_get_many(self):
+        """Test setting and retrieving bits at many indices against lists of bits."""
+        random.seed(0)
+        for _ in range(1000):
+            (x, length) = (random.getrandbits(4), random.randint(1, 40))
+            (b, bs) = (bitlist(x, length), list(bitlist(x, length)))
+            indices = random.sample(range(length), random.randint(0, length))
+            v = random.randint(0, 1)
+            b.set_many(indices, v)
+            for i in indices:
+                bs[i] = v
+            self.assertEqual((len(b), list(b)), (len(bs), bs))
+            self.assertEqual(b.get_many(indices), [bs[i] for i in indices])
+
+    def test_sorted_bisect(self):
+        """Test sorting and searching collections of bit vectors by integer value."""
+        random.seed(0)
+        bs = [bitlist(random.getrandbits(6), random.randint(0, 10)) for _ in range(500)]
+        ss = bitlist.sorted(bs)
+        self.assertEqual(ss, sorted(bs))
+        self.assertEqual([int(b) for b in ss], sorted(int(b) for b in bs))
+        self.assertEqual(bitlist.sorted(bs, reverse=True), sorted(bs, reverse=True))
+
+        ns = [int(b) for b in ss]
+        for n in range(-1, 66):
+            (lo, hi) = (random.randint(0, 250), random.choice([None, random.randint(250, 500)]))
+            self.assertEqual(
+                bitlist.bisect_left(ss, bitlist(max(n, 0), 8) if n >= 0 else n, lo, hi),
+                bisect.bisect_left(ns, n, lo, len(ns) if hi is None else hi)
+            )
+            self.assertEqual(
+                bitlist.bisect_right(ss, n, lo, hi),
+                bisect.bisect_right(ns, n, lo, len(ns) if hi is None else hi)
+            )
+
 # Always invoke the doctests in this module.
 doctest.testmod()